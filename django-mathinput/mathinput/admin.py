@@ -3,28 +3,55 @@ Django Admin integration for MathInput widget.
 
 Provides admin form classes and utilities for using MathInputWidget in Django Admin.
 """
+from functools import lru_cache
+
 from django import forms
 from django.contrib import admin
-from mathinput.widgets import MathInputWidget
+from mathinput.widgets import MathInputWidget, get_shared_widget
 
 
 class MathInputAdminForm(forms.ModelForm):
     """
     Admin form class that uses MathInputWidget for math formula fields.
     
+    Widgets for the fields listed in ``mathinput_fields`` are attached once,
+    when the subclass is defined, rather than on every admin instantiation.
+    
     Usage:
         from mathinput.admin import MathInputAdminForm
         
-        @admin.register(Problem)
-        class ProblemAdmin(admin.ModelAdmin):
-            form = MathInputAdminForm
+        class ProblemAdminForm(MathInputAdminForm):
+            mathinput_fields = {
+                'equation': {'mode': 'regular_functions', 'preset': 'algebra'},
+            }
             
             class Meta:
-                widgets = {
-                    'equation': MathInputWidget(mode='regular_functions'),
-                }
+                model = Problem
+                fields = '__all__'
+        
+        @admin.register(Problem)
+        class ProblemAdmin(admin.ModelAdmin):
+            form = ProblemAdminForm
     """
-    pass
+    
+    # Override this in subclasses to specify which fields use MathInputWidget
+    mathinput_fields = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        
+        meta = getattr(cls, 'Meta', None)
+        if not cls.mathinput_fields or meta is None:
+            return
+        
+        # Runs before ModelFormMetaclass reads Meta, so the widgets apply to
+        # the generated fields. A Meta subclass keeps the declared one intact.
+        widgets = dict(getattr(meta, 'widgets', None) or {})
+        widgets.update({
+            field_name: get_shared_widget(config.get('mode'), config.get('preset'))
+            for field_name, config in cls.mathinput_fields.items()
+        })
+        cls.Meta = type('Meta', (meta,), {'widgets': widgets})
 
 
 def get_mathinput_widget_for_field(field_name, mode=None, preset=None):
@@ -44,6 +71,43 @@ def get_mathinput_widget_for_field(field_name, mode=None, preset=None):
     }
 
 
+def _make_form_class(model, field_configs):
+    """
+    Build a ModelForm class for a model with MathInputWidget on the given fields.
+    
+    Each model/configuration pair only creates its form class once, instead
+    of once per admin instantiation.
+    
+    Args:
+        model: Model class the form edits
+        field_configs: Hashable sequence of (field_name, mode, preset) triples
+    
+    Returns:
+        ModelForm subclass named MathInputForm
+    """
+    # Keyed by the shared widgets rather than the raw configuration, so a
+    # change to the default mode or preset settings yields a new form class
+    return _make_form_class_for_widgets(model, tuple(
+        (field_name, get_shared_widget(mode, preset))
+        for field_name, mode, preset in field_configs
+    ))
+
+
+@lru_cache(maxsize=64)
+def _make_form_class_for_widgets(model, field_widgets):
+    """Build (once) the form class for _make_form_class()."""
+    form_model = model
+    form_widgets = dict(field_widgets)
+    
+    class MathInputForm(forms.ModelForm):
+        class Meta:
+            model = form_model
+            fields = '__all__'
+            widgets = form_widgets
+    
+    return MathInputForm
+
+
 class MathInputAdminMixin:
     """
     Mixin class for ModelAdmin to easily add MathInputWidget support.
@@ -62,41 +126,37 @@ class MathInputAdminMixin:
     # Override this in your ModelAdmin to specify which fields use MathInputWidget
     mathinput_fields = {}
     
+    # mathinput_fields flattened to (field_name, mode, preset) triples
+    _mathinput_fields_frozen = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._mathinput_fields_frozen = tuple(
+            (field_name, config.get('mode'), config.get('preset'))
+            for field_name, config in cls.mathinput_fields.items()
+        )
+    
     def __init__(self, model, admin_site):
         super().__init__(model, admin_site)
         
         # Configure widgets for math input fields
-        if self.mathinput_fields:
-            if not hasattr(self, 'form') or self.form is None:
-                # Create a form class dynamically if none exists
-                class MathInputForm(forms.ModelForm):
-                    class Meta:
-                        model = model
-                        fields = '__all__'
-                        widgets = {}
-                
-                # Add widgets for math input fields
-                for field_name, config in self.mathinput_fields.items():
-                    mode = config.get('mode')
-                    preset = config.get('preset')
-                    MathInputForm.Meta.widgets[field_name] = MathInputWidget(
-                        mode=mode,
-                        preset=preset
-                    )
-                
-                self.form = MathInputForm
+        if self._mathinput_fields_frozen:
+            form_meta = getattr(getattr(self, 'form', None), 'Meta', None)
+            if form_meta is None:
+                # No form, or a bare ModelForm without Meta (the ModelAdmin
+                # default): use a form class built once per model and field
+                # configuration
+                self.form = _make_form_class(model, self._mathinput_fields_frozen)
             else:
                 # Add widgets to existing form
-                if not hasattr(self.form.Meta, 'widgets'):
-                    self.form.Meta.widgets = {}
+                widgets = getattr(form_meta, 'widgets', None)
+                if widgets is None:
+                    widgets = form_meta.widgets = {}
                 
-                for field_name, config in self.mathinput_fields.items():
-                    mode = config.get('mode')
-                    preset = config.get('preset')
-                    self.form.Meta.widgets[field_name] = MathInputWidget(
-                        mode=mode,
-                        preset=preset
-                    )
+                widgets.update({
+                    field_name: get_shared_widget(mode, preset)
+                    for field_name, mode, preset in self._mathinput_fields_frozen
+                })
 
 
 # Convenience function for registering admin with math input
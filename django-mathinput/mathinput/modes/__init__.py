@@ -9,31 +9,37 @@ Provides configuration for different math input modes:
 - statistics_probability: Statistical notation
 - physics_engineering: Physics and engineering notation
 """
-from typing import Dict, Optional
+import importlib
+from types import MappingProxyType
+from typing import Mapping
 
-# Import all mode modules
-from .regular_functions import get_mode as get_regular_functions
-from .advanced_expressions import get_mode as get_advanced_expressions
-from .integrals_differentials import get_mode as get_integrals_differentials
-from .matrices import get_mode as get_matrices
-from .statistics_probability import get_mode as get_statistics_probability
-from .physics_engineering import get_mode as get_physics_engineering
+# Mode registry: code -> configuration, from the shared data table
+from ._data import MODES as _MODE_REGISTRY
 
-# Mode registry
-_MODE_REGISTRY = {
-    'regular_functions': get_regular_functions,
-    'advanced_expressions': get_advanced_expressions,
-    'integrals_differentials': get_integrals_differentials,
-    'matrices': get_matrices,
-    'statistics_probability': get_statistics_probability,
-    'physics_engineering': get_physics_engineering,
-}
+# All mode configurations, as a read-only view of the registry
+_ALL_MODES = MappingProxyType(_MODE_REGISTRY)
+
+# Valid mode codes (ordered, for iteration)
+VALID_MODES = tuple(_MODE_REGISTRY)
+
+# Valid mode codes (for O(1) membership checks)
+_VALID_MODE_SET = frozenset(VALID_MODES)
 
-# Valid mode codes
-VALID_MODES = list(_MODE_REGISTRY.keys())
+# Comma-separated list of valid codes for error messages
+_VALID_MODES_STR = ', '.join(VALID_MODES)
+
+# Legacy per-mode getter names, imported lazily from their modules
+_LAZY_GETTERS = {
+    'get_regular_functions': 'regular_functions',
+    'get_advanced_expressions': 'advanced_expressions',
+    'get_integrals_differentials': 'integrals_differentials',
+    'get_matrices': 'matrices',
+    'get_statistics_probability': 'statistics_probability',
+    'get_physics_engineering': 'physics_engineering',
+}
 
 
-def load_mode(mode_code: str) -> Dict:
+def load_mode(mode_code: str) -> Mapping:
     """
     Load mode configuration by code.
     
@@ -41,7 +47,7 @@ def load_mode(mode_code: str) -> Dict:
         mode_code: Mode identifier (e.g., 'regular_functions', 'matrices')
     
     Returns:
-        Mode configuration dictionary
+        Read-only mode configuration mapping, shared between callers
     
     Raises:
         ValueError: If mode_code is not valid
@@ -51,28 +57,28 @@ def load_mode(mode_code: str) -> Dict:
         >>> mode['name']
         'Regular Functions'
     """
-    if mode_code not in _MODE_REGISTRY:
+    try:
+        return _MODE_REGISTRY[mode_code]
+    except KeyError:
         raise ValueError(
             f"Invalid mode code: '{mode_code}'. "
-            f"Valid modes: {', '.join(VALID_MODES)}"
-        )
-    
-    return _MODE_REGISTRY[mode_code]()
+            f"Valid modes: {_VALID_MODES_STR}"
+        ) from None
 
 
-def get_all_modes() -> Dict[str, Dict]:
+def get_all_modes() -> Mapping[str, Mapping]:
     """
     Get all available mode configurations.
     
     Returns:
-        Dictionary mapping mode codes to mode configurations
+        Read-only mapping of mode codes to mode configurations
     
     Example:
         >>> all_modes = get_all_modes()
         >>> 'regular_functions' in all_modes
         True
     """
-    return {code: load_mode(code) for code in VALID_MODES}
+    return _ALL_MODES
 
 
 def is_valid_mode(mode_code: str) -> bool:
@@ -91,5 +97,21 @@ def is_valid_mode(mode_code: str) -> bool:
         >>> is_valid_mode('invalid_mode')
         False
     """
-    return mode_code in _MODE_REGISTRY
+    return mode_code in _VALID_MODE_SET
 
+
+def __getattr__(name):
+    """
+    Resolve legacy per-mode getters (e.g. get_regular_functions) on first access.
+    
+    The mode modules are no longer imported with the package; they are
+    only loaded when one of these names is actually used (PEP 562).
+    """
+    try:
+        module_name = _LAZY_GETTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    getter = importlib.import_module(f'.{module_name}', __name__).get_mode
+    globals()[name] = getter
+    return getter
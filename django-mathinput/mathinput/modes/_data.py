@@ -0,0 +1,184 @@
+"""
+Mode configuration table.
+
+All mode configurations live in this single module so that importing
+the mode system loads one small data module instead of one module per
+mode. Each configuration is read-only and shared between callers.
+"""
+from types import MappingProxyType
+
+
+# Regular Functions mode configuration
+# Target Users: High school students, basic math courses
+# Toolbar Focus: Text formatting, Basic operations, Trigonometry
+REGULAR_FUNCTIONS = MappingProxyType({
+    "name": "Regular Functions",
+    "code": "regular_functions",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "basic", "trig"),
+        "hidden": ("advanced", "calculus", "matrices", "symbols"),
+        "priority": ("basic", "text", "trig")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "large",  # 44×44px minimum for touch-friendly educational use
+        "grouping": "basic_operations"
+    }),
+    "quick_inserts": (
+        ("Simple Function", r"f(x) = x^2 + 1"),
+        ("Trigonometric Function", r"g(x) = \sin(x) + \cos(x)"),
+        ("Logarithmic Function", r"h(x) = \log(x)"),
+        ("Exponential Function", r"k(x) = e^x"),
+        ("Polynomial", r"p(x) = x^2 + 3x - 5"),
+    )
+})
+
+
+# Advanced Expressions mode configuration
+# Target Users: College students, advanced algebra
+# Toolbar Focus: Text, Basic, Advanced, Symbols
+ADVANCED_EXPRESSIONS = MappingProxyType({
+    "name": "Advanced Expressions",
+    "code": "advanced_expressions",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "basic", "advanced", "symbols"),
+        "hidden": ("calculus", "matrices", "trig"),
+        "priority": ("advanced", "basic", "symbols", "text")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "medium",
+        "grouping": "all_operations"
+    }),
+    "quick_inserts": (
+        ("Complex Fraction", r"\frac{x^2 + 3x - 5}{x - 1}"),
+        ("Nested Expression", r"\sqrt{\frac{a}{b} + \frac{c}{d}}"),
+        ("Summation", r"\sum_{i=1}^{n} x_i"),
+        ("Product", r"\prod_{i=1}^{n} a_i"),
+        ("Limit", r"\lim_{x \to \infty} f(x)"),
+    )
+})
+
+
+# Integrals/Differentials mode configuration
+# Target Users: Calculus students, engineers, mathematicians
+# Toolbar Focus: Calculus, Advanced, Basic, Text
+INTEGRALS_DIFFERENTIALS = MappingProxyType({
+    "name": "Integrals/Differentials",
+    "code": "integrals_differentials",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "calculus", "advanced", "basic"),
+        "hidden": ("trig", "symbols", "matrices"),
+        "priority": ("calculus", "advanced", "basic", "text")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "large",  # Prominent calculus operations
+        "grouping": "calculus_operations"
+    }),
+    "quick_inserts": (
+        ("Indefinite Integral", r"\int f(x) \, dx"),
+        ("Definite Integral", r"\int_{a}^{b} f(x) \, dx"),
+        ("Derivative", r"\frac{d}{dx}"),
+        ("Partial Derivative", r"\frac{\partial}{\partial x}"),
+        ("Gradient", r"\nabla f"),
+        ("Divergence", r"\nabla \cdot \mathbf{F}"),
+        ("Curl", r"\nabla \times \mathbf{F}"),
+        ("Limit", r"\lim_{x \to a} f(x)"),
+        ("Summation", r"\sum_{i=1}^{n} a_i"),
+        ("Product", r"\prod_{i=1}^{n} a_i"),
+    )
+})
+
+
+# Matrices mode configuration
+# Target Users: Linear algebra students, ML practitioners, data scientists
+# Toolbar Focus: Matrices, Advanced, Symbols, Text
+MATRICES = MappingProxyType({
+    "name": "Matrices",
+    "code": "matrices",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "matrices", "advanced", "symbols"),
+        "hidden": ("basic", "trig", "calculus"),
+        "priority": ("matrices", "advanced", "symbols", "text")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "medium",
+        "grouping": "matrix_operations"
+    }),
+    "quick_inserts": (
+        ("2×2 Matrix", r"\begin{pmatrix} a & b \\ c & d \end{pmatrix}"),
+        ("3×3 Matrix", r"\begin{bmatrix} a & b & c \\ d & e & f \\ g & h & i \end{bmatrix}"),
+        ("Matrix Inverse", r"A^{-1}"),
+        ("Matrix Transpose", r"A^T"),
+        ("Determinant", r"\det(A)"),
+        ("Vector", r"\mathbf{v} = \begin{pmatrix} x \\ y \\ z \end{pmatrix}"),
+        ("Matrix Product", r"AB"),
+        ("ML Layer Notation", r"W^{[l]}"),
+    )
+})
+
+
+# Statistics & Probability mode configuration
+# Target Users: Statistics students, data analysts
+# Toolbar Focus: Advanced, Symbols, Basic, Text
+STATISTICS_PROBABILITY = MappingProxyType({
+    "name": "Statistics & Probability",
+    "code": "statistics_probability",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "advanced", "symbols", "basic"),
+        "hidden": ("calculus", "matrices", "trig"),
+        "priority": ("symbols", "advanced", "basic", "text")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "medium",
+        "grouping": "statistical_operations"
+    }),
+    "quick_inserts": (
+        ("Conditional Probability", r"P(A|B) = \frac{P(A \cap B)}{P(B)}"),
+        ("Expected Value", r"E[X] = \sum_{i=1}^{n} x_i P(x_i)"),
+        ("Mean", r"\bar{x} = \frac{1}{n}\sum_{i=1}^{n} x_i"),
+        ("Variance", r"\text{Var}(X) = E[X^2] - (E[X])^2"),
+        ("Standard Deviation", r"\sigma = \sqrt{\text{Var}(X)}"),
+        ("Chi-Squared", r"\chi^2"),
+        ("Normal Distribution", r"X \sim \mathcal{N}(\mu, \sigma^2)"),
+        ("Covariance", r"\text{Cov}(X, Y) = E[XY] - E[X]E[Y]"),
+    )
+})
+
+
+# Physics & Engineering mode configuration
+# Target Users: Physics students, engineers
+# Toolbar Focus: Calculus, Symbols, Advanced, Text
+PHYSICS_ENGINEERING = MappingProxyType({
+    "name": "Physics & Engineering",
+    "code": "physics_engineering",
+    "toolbars": MappingProxyType({
+        "visible": ("text", "calculus", "symbols", "advanced"),
+        "hidden": ("basic", "trig", "matrices"),
+        "priority": ("calculus", "symbols", "advanced", "text")
+    }),
+    "button_layout": MappingProxyType({
+        "size": "medium",
+        "grouping": "physics_operations"
+    }),
+    "quick_inserts": (
+        ("Curl", r"\nabla \times \mathbf{F}"),
+        ("Divergence", r"\nabla \cdot \mathbf{F}"),
+        ("Gradient", r"\nabla f"),
+        ("Laplacian", r"\nabla^2 f"),
+        ("Tensor", r"T^{\mu\nu}"),
+        ("4-Vector", r"x^\mu = (ct, x, y, z)"),
+        ("Planck Constant", r"\hbar"),
+        ("Speed of Light", r"c"),
+        ("Schrödinger Equation", r"i\hbar\frac{\partial}{\partial t}\psi = \hat{H}\psi"),
+    )
+})
+
+
+# Mode code -> configuration
+MODES = {
+    'regular_functions': REGULAR_FUNCTIONS,
+    'advanced_expressions': ADVANCED_EXPRESSIONS,
+    'integrals_differentials': INTEGRALS_DIFFERENTIALS,
+    'matrices': MATRICES,
+    'statistics_probability': STATISTICS_PROBABILITY,
+    'physics_engineering': PHYSICS_ENGINEERING,
+}
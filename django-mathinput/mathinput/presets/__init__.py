@@ -9,31 +9,37 @@ Provides domain-specific configurations that work with modes:
 - statistics: Statistical analysis
 - probability: Probability theory
 """
-from typing import Dict
+import importlib
+from types import MappingProxyType
+from typing import Mapping
 
-# Import all preset modules
-from .algebra import get_preset as get_algebra
-from .calculus import get_preset as get_calculus
-from .physics import get_preset as get_physics
-from .machine_learning import get_preset as get_machine_learning
-from .statistics import get_preset as get_statistics
-from .probability import get_preset as get_probability
+# Preset registry: code -> configuration, from the shared data table
+from ._data import PRESETS as _PRESET_REGISTRY
 
-# Preset registry
-_PRESET_REGISTRY = {
-    'algebra': get_algebra,
-    'calculus': get_calculus,
-    'physics': get_physics,
-    'machine_learning': get_machine_learning,
-    'statistics': get_statistics,
-    'probability': get_probability,
-}
+# All preset configurations, as a read-only view of the registry
+_ALL_PRESETS = MappingProxyType(_PRESET_REGISTRY)
+
+# Valid preset codes (ordered, for iteration)
+VALID_PRESETS = tuple(_PRESET_REGISTRY)
+
+# Valid preset codes (for O(1) membership checks)
+_VALID_PRESET_SET = frozenset(VALID_PRESETS)
 
-# Valid preset codes
-VALID_PRESETS = list(_PRESET_REGISTRY.keys())
+# Comma-separated list of valid codes for error messages
+_VALID_PRESETS_STR = ', '.join(VALID_PRESETS)
+
+# Legacy per-preset getter names, imported lazily from their modules
+_LAZY_GETTERS = {
+    'get_algebra': 'algebra',
+    'get_calculus': 'calculus',
+    'get_physics': 'physics',
+    'get_machine_learning': 'machine_learning',
+    'get_statistics': 'statistics',
+    'get_probability': 'probability',
+}
 
 
-def load_preset(preset_code: str) -> Dict:
+def load_preset(preset_code: str) -> Mapping:
     """
     Load preset configuration by code.
     
@@ -41,7 +47,7 @@ def load_preset(preset_code: str) -> Dict:
         preset_code: Preset identifier (e.g., 'algebra', 'calculus')
     
     Returns:
-        Preset configuration dictionary
+        Read-only preset configuration mapping, shared between callers
     
     Raises:
         ValueError: If preset_code is not valid
@@ -51,28 +57,28 @@ def load_preset(preset_code: str) -> Dict:
         >>> preset['name']
         'Algebra'
     """
-    if preset_code not in _PRESET_REGISTRY:
+    try:
+        return _PRESET_REGISTRY[preset_code]
+    except KeyError:
         raise ValueError(
             f"Invalid preset code: '{preset_code}'. "
-            f"Valid presets: {', '.join(VALID_PRESETS)}"
-        )
-    
-    return _PRESET_REGISTRY[preset_code]()
+            f"Valid presets: {_VALID_PRESETS_STR}"
+        ) from None
 
 
-def get_all_presets() -> Dict[str, Dict]:
+def get_all_presets() -> Mapping[str, Mapping]:
     """
     Get all available preset configurations.
     
     Returns:
-        Dictionary mapping preset codes to preset configurations
+        Read-only mapping of preset codes to preset configurations
     
     Example:
         >>> all_presets = get_all_presets()
         >>> 'algebra' in all_presets
         True
     """
-    return {code: load_preset(code) for code in VALID_PRESETS}
+    return _ALL_PRESETS
 
 
 def is_valid_preset(preset_code: str) -> bool:
@@ -91,5 +97,21 @@ def is_valid_preset(preset_code: str) -> bool:
         >>> is_valid_preset('invalid_preset')
         False
     """
-    return preset_code in _PRESET_REGISTRY
+    return preset_code in _VALID_PRESET_SET
 
+
+def __getattr__(name):
+    """
+    Resolve legacy per-preset getters (e.g. get_algebra) on first access.
+    
+    The preset modules are no longer imported with the package; they are
+    only loaded when one of these names is actually used (PEP 562).
+    """
+    try:
+        module_name = _LAZY_GETTERS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    
+    getter = importlib.import_module(f'.{module_name}', __name__).get_preset
+    globals()[name] = getter
+    return getter
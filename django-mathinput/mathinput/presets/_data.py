@@ -0,0 +1,150 @@
+"""
+Preset configuration table.
+
+All preset configurations live in this single module so that importing
+the preset system loads one small data module instead of one module per
+preset. Each configuration is read-only and shared between callers.
+"""
+from types import MappingProxyType
+
+
+# Algebra preset configuration
+# Domain: Basic algebraic operations, polynomials, equations
+# Recommended Modes: regular_functions, advanced_expressions
+ALGEBRA = MappingProxyType({
+    "name": "Algebra",
+    "code": "algebra",
+    "tab_order": ("text", "basic", "advanced", "symbols", "trig", "calculus", "matrices"),
+    "quick_inserts": (
+        ("Quadratic Equation", r"ax^2 + bx + c = 0"),
+        ("Polynomial", r"p(x) = a_n x^n + a_{n-1} x^{n-1} + \cdots + a_0"),
+        ("Square", r"x^2"),
+        ("Square Root", r"\sqrt{x}"),
+        ("Fraction", r"\frac{a}{b}"),
+        ("Absolute Value", r"|x|"),
+        ("Factorial", r"n!"),
+    ),
+    "highlight_buttons": ("x²", "√", "/", "=", "+", "-", "×", "÷"),
+    "recommended_modes": ("regular_functions", "advanced_expressions")
+})
+
+
+# Calculus preset configuration
+# Domain: Calculus, derivatives, integrals, limits
+# Recommended Modes: integrals_differentials
+CALCULUS = MappingProxyType({
+    "name": "Calculus",
+    "code": "calculus",
+    "tab_order": ("text", "calculus", "basic", "advanced", "symbols", "trig", "matrices"),
+    "quick_inserts": (
+        ("Indefinite Integral", r"\int f(x) \, dx"),
+        ("Definite Integral", r"\int_{a}^{b} f(x) \, dx"),
+        ("Derivative", r"\frac{d}{dx}"),
+        ("Partial Derivative", r"\frac{\partial}{\partial x}"),
+        ("Limit", r"\lim_{x \to a} f(x)"),
+        ("Second Derivative", r"\frac{d^2}{dx^2}"),
+        ("Chain Rule", r"\frac{d}{dx}[f(g(x))] = f'(g(x)) \cdot g'(x)"),
+        ("Fundamental Theorem", r"\int_{a}^{b} f'(x) \, dx = f(b) - f(a)"),
+    ),
+    "highlight_buttons": ("∫", "d/dx", "∂/∂x", "lim", "∑", "∏"),
+    "recommended_modes": ("integrals_differentials",)
+})
+
+
+# Physics preset configuration
+# Domain: Physics, engineering, tensor calculus
+# Recommended Modes: physics_engineering
+PHYSICS = MappingProxyType({
+    "name": "Physics",
+    "code": "physics",
+    "tab_order": ("text", "calculus", "symbols", "advanced", "basic", "trig", "matrices"),
+    "quick_inserts": (
+        ("Gradient", r"\nabla f"),
+        ("Divergence", r"\nabla \cdot \mathbf{F}"),
+        ("Curl", r"\nabla \times \mathbf{F}"),
+        ("Laplacian", r"\nabla^2 f"),
+        ("Tensor", r"T^{\mu\nu}"),
+        ("4-Vector", r"x^\mu = (ct, x, y, z)"),
+        ("Planck Constant", r"\hbar"),
+        ("Schrödinger Equation", r"i\hbar\frac{\partial}{\partial t}\psi = \hat{H}\psi"),
+        ("Maxwell Equations", r"\nabla \cdot \mathbf{E} = \frac{\rho}{\epsilon_0}"),
+    ),
+    "highlight_buttons": ("∇", "∂", "ℏ", "c", "×", "·", "μ", "ν"),
+    "recommended_modes": ("physics_engineering",)
+})
+
+
+# Machine Learning preset configuration
+# Domain: Neural networks, optimization, linear algebra
+# Recommended Modes: matrices, advanced_expressions
+MACHINE_LEARNING = MappingProxyType({
+    "name": "Machine Learning",
+    "code": "machine_learning",
+    "tab_order": ("text", "matrices", "advanced", "symbols", "calculus", "basic", "trig"),
+    "quick_inserts": (
+        ("Neural Layer", r"a^{[l]} = \sigma(W^{[l]} a^{[l-1]} + b^{[l]})"),
+        ("Loss Function", r"\mathcal{L} = -\sum_{i=1}^{m} y^{(i)} \log(\hat{y}^{(i)})"),
+        ("Gradient", r"\nabla_\theta J(\theta)"),
+        ("Matrix Product", r"W \mathbf{x} + \mathbf{b}"),
+        ("Activation Function", r"\sigma(z) = \frac{1}{1 + e^{-z}}"),
+        ("Backpropagation", r"\frac{\partial \mathcal{L}}{\partial W^{[l]}}"),
+        ("Regularization", r"J(\theta) = \frac{1}{m}\sum L(\hat{y}, y) + \frac{\lambda}{2m}\sum \theta^2"),
+    ),
+    "highlight_buttons": ("W", "σ", "𝔼", "θ", "⊙", "[l]", "∇"),
+    "recommended_modes": ("matrices", "advanced_expressions")
+})
+
+
+# Statistics preset configuration
+# Domain: Statistical analysis, data science
+# Recommended Modes: statistics_probability
+STATISTICS = MappingProxyType({
+    "name": "Statistics",
+    "code": "statistics",
+    "tab_order": ("text", "advanced", "symbols", "basic", "calculus", "trig", "matrices"),
+    "quick_inserts": (
+        ("Mean", r"\bar{x} = \frac{1}{n}\sum_{i=1}^{n} x_i"),
+        ("Variance", r"\text{Var}(X) = E[X^2] - (E[X])^2"),
+        ("Standard Deviation", r"\sigma = \sqrt{\text{Var}(X)}"),
+        ("Chi-Squared", r"\chi^2"),
+        ("Normal Distribution", r"X \sim \mathcal{N}(\mu, \sigma^2)"),
+        ("Hypothesis Test", r"H_0: \mu = \mu_0"),
+        ("Confidence Interval", r"\bar{x} \pm z_{\alpha/2} \frac{\sigma}{\sqrt{n}}"),
+        ("Correlation", r"r = \frac{\sum (x_i - \bar{x})(y_i - \bar{y})}{\sqrt{\sum (x_i - \bar{x})^2 \sum (y_i - \bar{y})^2}}"),
+    ),
+    "highlight_buttons": ("μ", "σ", "χ²", "∑", "𝔼", "~", "±"),
+    "recommended_modes": ("statistics_probability",)
+})
+
+
+# Probability preset configuration
+# Domain: Probability theory, stochastic processes
+# Recommended Modes: statistics_probability
+PROBABILITY = MappingProxyType({
+    "name": "Probability",
+    "code": "probability",
+    "tab_order": ("text", "advanced", "symbols", "basic", "calculus", "trig", "matrices"),
+    "quick_inserts": (
+        ("Conditional Probability", r"P(A|B) = \frac{P(A \cap B)}{P(B)}"),
+        ("Bayes' Theorem", r"P(A|B) = \frac{P(B|A) P(A)}{P(B)}"),
+        ("Expected Value", r"E[X] = \sum_{i=1}^{n} x_i P(x_i)"),
+        ("Variance", r"\text{Var}(X) = E[X^2] - (E[X])^2"),
+        ("Covariance", r"\text{Cov}(X, Y) = E[XY] - E[X]E[Y]"),
+        ("Binomial Distribution", r"P(X = k) = \binom{n}{k} p^k (1-p)^{n-k}"),
+        ("Poisson Distribution", r"P(X = k) = \frac{\lambda^k e^{-\lambda}}{k!}"),
+        ("Normal Distribution", r"f(x) = \frac{1}{\sigma\sqrt{2\pi}} e^{-\frac{(x-\mu)^2}{2\sigma^2}}"),
+    ),
+    "highlight_buttons": ("P", "E", "∩", "∪", "|", "~", "λ", "μ", "σ"),
+    "recommended_modes": ("statistics_probability",)
+})
+
+
+# Preset code -> configuration
+PRESETS = {
+    'algebra': ALGEBRA,
+    'calculus': CALCULUS,
+    'physics': PHYSICS,
+    'machine_learning': MACHINE_LEARNING,
+    'statistics': STATISTICS,
+    'probability': PROBABILITY,
+}
@@ -5,7 +5,7 @@ Provides functions to sanitize LaTeX input, extract commands,
 and detect dangerous patterns to prevent XSS and command injection attacks.
 """
 import re
-from typing import List, Set, Optional
+from typing import Iterator, List, Set, Optional
 
 
 # Dangerous LaTeX commands to block
@@ -44,18 +44,87 @@ DANGEROUS_COMMANDS = [
 ]
 
 
+# Patterns that span user-controlled text ([^}]*, [^>]+, on\w+) are not
+# used as written: a failed attempt at every possible start would rescan the
+# rest of the input, which is quadratic on inputs such as '<' * 10000 or
+# 'on' * 5000. The scanners below match the same text but keep each attempt
+# from running past the point where the next one would start, so the input
+# is scanned in linear time and nothing is cut off at a fixed length.
+
+# \href{...javascript: prefix. Same as the DANGEROUS_COMMANDS entry, except
+# that the span stops at the next \href{, where the search picks up again.
+_HREF_JS_PREFIX_PATTERN = r'\\href\s*\{(?:(?!\\href\s*\{)[^}])*javascript:'
+
+# DANGEROUS_COMMANDS with the linear \href prefix in place of the original
+_COMMAND_PATTERNS = [
+    _HREF_JS_PREFIX_PATTERN if pattern.startswith(r'\\href') else pattern
+    for pattern in DANGEROUS_COMMANDS
+]
+
+# Innermost \href{...} command (whole command, for removal). Only the ones
+# with a javascript: target are dropped, see _strip_javascript_href().
+_HREF_RE = re.compile(r'\\href\s*\{(?:(?!\\href\s*\{)[^}])*\}', re.IGNORECASE)
+_JAVASCRIPT_RE = re.compile('javascript:', re.IGNORECASE)
+
+# Any HTML tag. Only searched up to the last '>' (see _html_tag_end()).
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Event handler attribute (for detection), equivalent to on\w+\s*=. A match
+# is only tried at the start of a word, and only if that word is followed by
+# '='; the 'on' is then looked for inside it.
+_EVENT_DETECT_PATTERN = r'(?<!\w)(?=\w+\s*=)\w*?on\w'
+
+# Event handler attribute with a quoted value, plus the whitespace before it
+# (for removal). Anchored like the detection pattern: at the start of a
+# whitespace run, then at the start of the word holding the 'on'.
+_EVENT_RE = re.compile(
+    r'(?<!\s)(\s*)(?<!\w)(?=\w+\s*=\s*["\'][^"\']*["\'])(\w*?)'
+    r'on\w+\s*=\s*["\'][^"\']*["\']',
+    re.IGNORECASE,
+)
+
+# Everything contains_dangerous_pattern() looks for apart from HTML tags,
+# as one case-insensitive alternation, so the input is scanned once instead
+# of once per pattern.
+_DETECT_RE = re.compile(
+    '|'.join([*_COMMAND_PATTERNS, _EVENT_DETECT_PATTERN]),
+    re.IGNORECASE,
+)
+
+# The dangerous commands sanitize_latex() strips, as one alternation
+_SANITIZE_RE = re.compile('|'.join(_COMMAND_PATTERNS), re.IGNORECASE)
+
+# Literal text that every match of the patterns above must contain
+# (lowercased). Inputs with none of these cannot match, so the regex scan is
+# skipped for them. Event handlers additionally need both 'on' and '='.
+_SENTINELS = (
+    '\\input', '\\include', '\\verbatiminput', '\\lstinputlisting', '\\write18',
+    '\\def', '\\newcommand', '\\renewcommand', '\\providecommand',
+    '\\usepackage', '\\requirepackage', '\\documentclass',
+    '\\catcode', '\\makeatletter', '\\makeatother',
+    'javascript:', '<',
+)
+
+# Upper bound on sanitize_latex() passes. Real formulas settle after one or
+# two; only deliberately nested fragments such as '\\de' * n + 'f' * n need more.
+_MAX_SANITIZE_PASSES = 8
+
+# LaTeX command: backslash followed by one or more letters
+_COMMAND_RE = re.compile(r'\\([a-zA-Z]+)')
+
+
 # Blocked command names (for whitelist checking)
-BLOCKED_COMMANDS = {
+BLOCKED_COMMANDS = frozenset({
     'input', 'include', 'write18', 'def', 'newcommand', 'renewcommand',
     'providecommand', 'verbatiminput', 'lstinputlisting', 'catcode',
     'makeatletter', 'makeatother', 'usepackage', 'RequirePackage',
     'documentclass', 'href',  # href is blocked if contains javascript:
-}
+})
 
 
 # Allowed LaTeX commands (whitelist)
 # This is a comprehensive list of safe mathematical commands
-ALLOWED_COMMANDS = {
+ALLOWED_COMMANDS = frozenset({
     # Math operations
     'frac', 'sqrt', 'root', 'sum', 'int', 'prod', 'lim', 'inf',
     # Functions
@@ -111,7 +180,62 @@ ALLOWED_COMMANDS = {
     'angle', 'measuredangle', 'sphericalangle',
     'parallel', 'nparallel', 'perp',
     'propto', 'asymp',
-}
+})
+
+
+def _may_be_dangerous(latex_string: str) -> bool:
+    """
+    Cheap prefilter: False only if the string cannot match any dangerous pattern.
+    
+    Non-ASCII strings always pass through to the regex scan, because
+    re.IGNORECASE folds characters such as 'ı' and 'ſ' onto ASCII letters
+    that str.lower() leaves alone.
+    """
+    if not latex_string.isascii():
+        return True
+    
+    lowered = latex_string.lower()
+    if 'on' in lowered and '=' in lowered:
+        return True
+    
+    return any(sentinel in lowered for sentinel in _SENTINELS)
+
+
+def _html_tag_end(latex_string: str) -> int:
+    """
+    Index just past the last '>' in the string (0 if there is none).
+    
+    No HTML tag can match beyond it, and a '<' with no '>' after it would
+    otherwise make every tag match attempt scan to the end of the string.
+    """
+    return latex_string.rfind('>') + 1
+
+
+def _strip_javascript_href(match: re.Match) -> str:
+    """Drop an \\href{...} command if its target is javascript:, else keep it."""
+    command = match.group()
+    return '' if _JAVASCRIPT_RE.search(command) else command
+
+
+def _strip_event_handler(match: re.Match) -> str:
+    """
+    Drop an event handler attribute matched by _EVENT_RE.
+    
+    The whitespace before it only goes with it when the 'on' starts the
+    word; otherwise (e.g. 'xonclick="..."') the removal starts at the 'on',
+    as it would for a plain search for on\\w+.
+    """
+    whitespace, prefix = match.group(1), match.group(2)
+    return whitespace + prefix if prefix else ''
+
+
+def _sanitize_pass(latex_string: str) -> str:
+    """Strip every dangerous construct from the string once, left to right."""
+    result = _HREF_RE.sub(_strip_javascript_href, latex_string)
+    result = _EVENT_RE.sub(_strip_event_handler, result)
+    result = _SANITIZE_RE.sub('', result)
+    tag_end = _html_tag_end(result)
+    return _HTML_TAG_RE.sub('', result[:tag_end]) + result[tag_end:]
 
 
 def sanitize_latex(latex_string: str) -> str:
@@ -129,7 +253,8 @@ def sanitize_latex(latex_string: str) -> str:
         latex_string: Input LaTeX string to sanitize
     
     Returns:
-        Sanitized LaTeX string with dangerous patterns removed
+        Sanitized LaTeX string with dangerous patterns removed (an empty
+        string if removing them keeps exposing new ones)
     
     Example:
         >>> sanitize_latex(r'\\input{file.tex}')
@@ -140,32 +265,21 @@ def sanitize_latex(latex_string: str) -> str:
     if not latex_string:
         return ''
     
-    result = latex_string
-    
-    # Remove dangerous command patterns
-    for pattern in DANGEROUS_COMMANDS:
-        result = re.sub(pattern, '', result, flags=re.IGNORECASE)
+    if not _may_be_dangerous(latex_string):
+        return latex_string
     
-    # Remove any remaining href with javascript: (case-insensitive)
-    result = re.sub(
-        r'\\href\s*\{[^}]*javascript:[^}]*\}',
-        '',
-        result,
-        flags=re.IGNORECASE
-    )
-    
-    # Remove any HTML tags
-    result = re.sub(r'<[^>]+>', '', result)
-    
-    # Remove any remaining event handlers
-    result = re.sub(
-        r'\s*(on\w+)\s*=\s*["\'][^"\']*["\']',
-        '',
-        result,
-        flags=re.IGNORECASE
-    )
+    # Removing one match can splice together another (e.g. '<scr\\defipt'),
+    # so repeat until nothing changes. Each pass rescans the whole string,
+    # so the number of passes is capped: input still producing new matches
+    # after that is nested on purpose and is dropped entirely.
+    result = latex_string
+    for _ in range(_MAX_SANITIZE_PASSES):
+        stripped = _sanitize_pass(result)
+        if stripped == result:
+            return result
+        result = stripped
     
-    return result
+    return ''
 
 
 def extract_commands(latex_string: str) -> List[str]:
@@ -188,12 +302,37 @@ def extract_commands(latex_string: str) -> List[str]:
     if not latex_string:
         return []
     
-    # Pattern: backslash followed by one or more letters
-    pattern = r'\\([a-zA-Z]+)'
-    matches = re.findall(pattern, latex_string)
+    # Remove duplicates, keeping first-appearance order
+    return list(dict.fromkeys(_COMMAND_RE.findall(latex_string)))
+
+
+def iter_commands(latex_string: str) -> Iterator[str]:
+    """
+    Lazily yield each distinct LaTeX command in a string.
+    
+    Like extract_commands, but commands are produced one at a time in order
+    of first appearance, so a caller that stops early never scans the rest
+    of the string.
     
-    # Remove duplicates and return
-    return list(set(matches))
+    Args:
+        latex_string: Input LaTeX string
+    
+    Yields:
+        Command names (without backslash), each once
+    
+    Example:
+        >>> next(iter_commands(r'\\input{x} \\frac{1}{2}'))
+        'input'
+    """
+    if not latex_string:
+        return
+    
+    seen = set()
+    for match in _COMMAND_RE.finditer(latex_string):
+        command = match.group(1)
+        if command not in seen:
+            seen.add(command)
+            yield command
 
 
 def contains_dangerous_pattern(latex_string: str) -> bool:
@@ -221,24 +360,13 @@ def contains_dangerous_pattern(latex_string: str) -> bool:
     if not latex_string:
         return False
     
-    # Check for dangerous command patterns
-    for pattern in DANGEROUS_COMMANDS:
-        if re.search(pattern, latex_string, re.IGNORECASE):
-            return True
-    
-    # Check for javascript: in href
-    if re.search(r'\\href\s*\{[^}]*javascript:', latex_string, re.IGNORECASE):
-        return True
-    
-    # Check for HTML tags
-    if re.search(r'<[^>]+>', latex_string):
-        return True
+    if not _may_be_dangerous(latex_string):
+        return False
     
-    # Check for event handlers
-    if re.search(r'\s*(on\w+)\s*=', latex_string, re.IGNORECASE):
+    if _DETECT_RE.search(latex_string):
         return True
     
-    return False
+    return _HTML_TAG_RE.search(latex_string, 0, _html_tag_end(latex_string)) is not None
 
 
 def is_command_allowed(command: str) -> bool:
@@ -260,6 +388,12 @@ def is_command_allowed(command: str) -> bool:
     if not command:
         return False
     
+    # Fast path: names extracted by the command regex are usually an exact
+    # whitelist entry. Every entry's lowercase form is also whitelisted and
+    # none is blocked, so no normalization is needed for them.
+    if command in ALLOWED_COMMANDS:
+        return True
+    
     # Normalize command name (lowercase, strip whitespace)
     command = command.lower().strip()
     
@@ -287,12 +421,15 @@ def validate_commands(latex_string: str) -> tuple[bool, List[str]]:
         >>> validate_commands(r'\\input{file}')
         (False, ['input'])
     """
-    commands = extract_commands(latex_string)
-    blocked = []
+    if not latex_string:
+        return (True, [])
     
-    for cmd in commands:
-        if not is_command_allowed(cmd):
-            blocked.append(cmd)
+    # Distinct commands in order of first appearance. Exact whitelist hits
+    # are removed with one C-level set difference; only the rest (usually
+    # none) go through the case-insensitive is_command_allowed() check.
+    commands = dict.fromkeys(_COMMAND_RE.findall(latex_string))
+    unknown = commands.keys() - ALLOWED_COMMANDS
+    blocked = [cmd for cmd in commands if cmd in unknown and not is_command_allowed(cmd)]
     
     return (len(blocked) == 0, blocked)
 
@@ -304,7 +441,7 @@ def get_blocked_commands() -> Set[str]:
     Returns:
         Set of blocked command names
     """
-    return BLOCKED_COMMANDS.copy()
+    return set(BLOCKED_COMMANDS)
 
 
 def get_allowed_commands() -> Set[str]:
@@ -314,5 +451,5 @@ def get_allowed_commands() -> Set[str]:
     Returns:
         Set of allowed command names
     """
-    return ALLOWED_COMMANDS.copy()
+    return set(ALLOWED_COMMANDS)
 
@@ -4,13 +4,28 @@ Template tags for MathInput widget.
 Provides template filters for rendering math input widgets and displaying formulas.
 """
 import re
+from functools import lru_cache
 from django import template
-from django.conf import settings
 from django.utils.safestring import mark_safe
-from mathinput.widgets import MathInputWidget
+from mathinput.widgets import _get_cached_setting, get_shared_widget
 
 register = template.Library()
 
+# HTML special characters -> entities, for escape_latex_for_html
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+
+# MathML content, anywhere in the value
+_MATHML_RE = re.compile(r'<math', re.IGNORECASE)
+
+# Formula wrapped in a matching pair of $ (inline) or $$ (display) delimiters
+_MATH_DELIMITERS_RE = re.compile(r'(\$\$?)(.*)\1\Z', re.DOTALL)
+
 
 @register.filter(name='as_mathinput')
 def as_mathinput(value, arg=None):
@@ -30,33 +45,10 @@ def as_mathinput(value, arg=None):
     Returns:
         Safe HTML string containing the widget
     """
-    mode = None
-    preset = None
+    mode, preset = _parse_widget_arg(arg) if arg else (None, None)
     
-    # Parse argument if provided
-    if arg:
-        # Check if it's a simple mode name (shorthand)
-        if ',' not in arg and '=' not in arg:
-            mode = arg
-        else:
-            # Parse key=value pairs
-            parts = arg.split(',')
-            for part in parts:
-                part = part.strip()
-                if '=' in part:
-                    key, val = part.split('=', 1)
-                    key = key.strip()
-                    val = val.strip()
-                    if key == 'mode':
-                        mode = val
-                    elif key == 'preset':
-                        preset = val
-                else:
-                    # If no =, treat as mode
-                    mode = part
-    
-    # Create widget with specified mode and preset
-    widget = MathInputWidget(mode=mode, preset=preset)
+    # Widget for this mode and preset (shared; rendering does not mutate it)
+    widget = get_shared_widget(mode, preset)
     
     # Render widget
     html = widget.render('field', value or '')
@@ -64,6 +56,47 @@ def as_mathinput(value, arg=None):
     return mark_safe(html)
 
 
+@lru_cache(maxsize=256)
+def _parse_widget_arg(arg):
+    """
+    Parse an as_mathinput argument into (mode, preset).
+    
+    Accepts "mode=value", "mode=value,preset=value", or just a mode name
+    as shorthand.
+    """
+    mode = None
+    preset = None
+    
+    # Check if it's a simple mode name (shorthand)
+    if ',' not in arg and '=' not in arg:
+        return (arg, None)
+    
+    # Parse key=value pairs
+    parts = arg.split(',')
+    for part in parts:
+        part = part.strip()
+        if '=' in part:
+            key, val = part.split('=', 1)
+            key = key.strip()
+            val = val.strip()
+            if key == 'mode':
+                mode = val
+            elif key == 'preset':
+                preset = val
+        else:
+            # If no =, treat as mode
+            mode = part
+    
+    return (mode, preset)
+
+
+def _strip_math_delimiters(value):
+    """Strip surrounding whitespace and a matching pair of $ or $$ delimiters."""
+    latex = value.strip()
+    match = _MATH_DELIMITERS_RE.match(latex)
+    return match.group(2) if match else latex
+
+
 @register.filter(name='render_math')
 def render_math(value, renderer=None):
     """
@@ -89,15 +122,10 @@ def render_math(value, renderer=None):
     if renderer:
         renderer_name = renderer.lower()
     else:
-        renderer_name = getattr(settings, 'MATHINPUT_RENDERER', 'katex').lower()
-    
-    # Detect format (LaTeX vs MathML)
-    is_mathml = value.strip().startswith('<math') or '<math' in value.lower()
-    is_latex = not is_mathml and ('\\' in value or value.strip().startswith('$'))
+        renderer_name = _get_cached_setting('MATHINPUT_RENDERER', 'katex').lower()
     
-    # If neither detected, assume LaTeX
-    if not is_mathml and not is_latex:
-        is_latex = True
+    # Detect format (LaTeX vs MathML); anything that is not MathML is LaTeX
+    is_mathml = _MATHML_RE.search(value) is not None
     
     # Render based on format and renderer
     if is_mathml:
@@ -110,13 +138,7 @@ def render_math(value, renderer=None):
             return mark_safe(f'<span class="mathjax-mathml">{value}</span>')
     else:
         # LaTeX - render with KaTeX or MathJax
-        latex = value.strip()
-        
-        # Remove dollar signs if present (inline math)
-        if latex.startswith('$') and latex.endswith('$'):
-            latex = latex[1:-1]
-        elif latex.startswith('$$') and latex.endswith('$$'):
-            latex = latex[2:-2]
+        latex = _strip_math_delimiters(value)
         
         if renderer_name == 'katex':
             # KaTeX rendering - create markup that KaTeX can process
@@ -155,14 +177,8 @@ def escape_latex_for_html(latex):
     Returns:
         Escaped string safe for HTML attributes
     """
-    # Replace HTML special characters
-    latex = latex.replace('&', '&amp;')
-    latex = latex.replace('<', '&lt;')
-    latex = latex.replace('>', '&gt;')
-    latex = latex.replace('"', '&quot;')
-    latex = latex.replace("'", '&#x27;')
-    
-    return latex
+    # Replace HTML special characters in a single pass
+    return latex.translate(_HTML_ESCAPE_TABLE)
 
 
 @register.filter(name='render_math_inline')
@@ -187,15 +203,9 @@ def render_math_inline(value, renderer=None):
     if renderer:
         renderer_name = renderer.lower()
     else:
-        renderer_name = getattr(settings, 'MATHINPUT_RENDERER', 'katex').lower()
-    
-    latex = value.strip()
+        renderer_name = _get_cached_setting('MATHINPUT_RENDERER', 'katex').lower()
     
-    # Remove dollar signs if present
-    if latex.startswith('$') and latex.endswith('$'):
-        latex = latex[1:-1]
-    elif latex.startswith('$$') and latex.endswith('$$'):
-        latex = latex[2:-2]
+    latex = _strip_math_delimiters(value)
     
     escaped_latex = escape_latex_for_html(latex)
     
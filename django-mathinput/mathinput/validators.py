@@ -6,16 +6,14 @@ matrix size, and command whitelist to prevent DoS attacks and ensure
 formulas are within acceptable complexity limits.
 """
 import re
+from functools import lru_cache
 from typing import Optional, Tuple
-from django.core.exceptions import ValidationError
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.conf import settings
 
 from .security import (
-    sanitize_latex,
-    extract_commands,
+    validate_commands,
     contains_dangerous_pattern,
-    is_command_allowed,
-    ALLOWED_COMMANDS,
 )
 
 # Configuration constants (can be overridden in Django settings)
@@ -23,13 +21,31 @@ def _get_setting(name, default):
     """Get Django setting with fallback if not configured."""
     try:
         return getattr(settings, name, default)
-    except Exception:
+    except ImproperlyConfigured:
         return default
 
 MAX_FORMULA_LENGTH = _get_setting('MATHINPUT_MAX_FORMULA_LENGTH', 10000)
 MAX_NESTING_DEPTH = _get_setting('MATHINPUT_MAX_NESTING_DEPTH', 50)
 MAX_MATRIX_SIZE = _get_setting('MATHINPUT_MAX_MATRIX_SIZE', (100, 100))
 
+# An escaped bracket or backslash. Escaping any other character (\frac, \,)
+# cannot change the nesting depth, so only these escapes matter.
+_ESCAPED_BRACKET_RE = re.compile(r'\\[\\{}()\[\]]')
+
+# Every byte except the six bracket characters, for bytes.translate deletion
+_NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b'{}()[]')
+
+_OPENING_BRACKETS = frozenset(b'{([')
+
+# Closing bracket -> opening bracket it matches (as byte values)
+_MATCHING_OPENER = dict(zip(b'})]', b'{(['))
+
+# Matrix environments checked by get_matrix_size, in reporting order.
+# Environment names are case-sensitive in LaTeX.
+_MATRIX_ENVIRONMENTS = ('matrix', 'pmatrix', 'bmatrix', 'Bmatrix', 'vmatrix', 'Vmatrix', 'array')
+
+_MATRIX_BEGIN_RE = re.compile(r'\\begin\{(' + '|'.join(_MATRIX_ENVIRONMENTS) + r')\}')
+
 
 class MathInputValidator:
     """
@@ -40,12 +56,14 @@ class MathInputValidator:
     - Command whitelist validation
     - Dangerous pattern detection
     - Complexity checks (nesting depth, matrix size)
-    - Sanitization
+    
+    A formula that passes every check contains nothing sanitize_latex()
+    would strip, so it is returned unchanged.
     
     Usage:
         validator = MathInputValidator()
         try:
-            sanitized = validator.validate(r'\\frac{1}{2}')
+            latex = validator.validate(r'\\frac{1}{2}')
         except ValidationError as e:
             # Handle validation error
     """
@@ -65,16 +83,16 @@ class MathInputValidator:
     
     def validate(self, latex_string: str) -> str:
         """
-        Validate and sanitize LaTeX formula.
+        Validate LaTeX formula.
         
-        Performs all validation checks and returns sanitized string.
+        Performs all validation checks and returns the string unchanged.
         Raises ValidationError if validation fails.
         
         Args:
             latex_string: Input LaTeX string to validate
         
         Returns:
-            Sanitized LaTeX string
+            The validated LaTeX string
         
         Raises:
             ValidationError: If validation fails
@@ -89,52 +107,15 @@ class MathInputValidator:
         if not latex_string:
             return ''
         
-        # 1. Length check
-        if len(latex_string) > self.max_length:
-            raise ValidationError(
-                f"Formula too long (max {self.max_length:,} characters, "
-                f"got {len(latex_string):,})"
-            )
-        
-        # 2. Dangerous pattern check (before other checks)
-        if contains_dangerous_pattern(latex_string):
-            raise ValidationError(
-                "Formula contains unsafe content. Dangerous patterns detected."
-            )
-        
-        # 3. Command whitelist validation
-        commands = extract_commands(latex_string)
-        blocked_commands = []
-        for cmd in commands:
-            if not is_command_allowed(cmd):
-                blocked_commands.append(cmd)
-        
-        if blocked_commands:
-            raise ValidationError(
-                f"Command(s) not allowed: {', '.join(blocked_commands)}"
-            )
-        
-        # 4. Complexity checks
-        nesting_depth = count_nesting(latex_string)
-        if nesting_depth > self.max_nesting:
-            raise ValidationError(
-                f"Formula too deeply nested (max {self.max_nesting} levels, "
-                f"got {nesting_depth})"
-            )
-        
-        # 5. Matrix size check
-        matrix_size = get_matrix_size(latex_string)
-        if matrix_size:
-            rows, cols = matrix_size
-            max_rows, max_cols = self.max_matrix_size
-            if rows > max_rows or cols > max_cols:
-                raise ValidationError(
-                    f"Matrix too large (max {max_rows}×{max_cols}, "
-                    f"got {rows}×{cols})"
-                )
-        
-        # 6. Sanitize and return
-        return sanitize_latex(latex_string)
+        error, latex = _validate_cached(
+            latex_string,
+            self.max_length,
+            self.max_nesting,
+            tuple(self.max_matrix_size),
+        )
+        if error:
+            raise ValidationError(error)
+        return latex
     
     def __call__(self, value):
         """
@@ -147,7 +128,7 @@ class MathInputValidator:
             value: Input LaTeX string to validate
         
         Returns:
-            Sanitized LaTeX string
+            The validated LaTeX string
         
         Raises:
             ValidationError: If validation fails
@@ -155,6 +136,70 @@ class MathInputValidator:
         return self.validate(value)
 
 
+@lru_cache(maxsize=1024)
+def _validate_cached(
+    latex_string: str,
+    max_length: int,
+    max_nesting: int,
+    max_matrix_size: Tuple[int, int],
+) -> Tuple[Optional[str], str]:
+    """
+    Run every MathInputValidator check on a formula, memoized per input and limits.
+    
+    The same formula is typically validated repeatedly (form re-renders,
+    previews, re-saves), and every check is a pure function of the string
+    and the limits. Failures are cached as their message rather than as an
+    exception, so each caller raises a fresh ValidationError.
+    
+    Returns:
+        Tuple of (error_message, latex). error_message is None if valid,
+        and latex is then the input string.
+    """
+    # 1. Length check
+    if len(latex_string) > max_length:
+        return (
+            f"Formula too long (max {max_length:,} characters, "
+            f"got {len(latex_string):,})",
+            '',
+        )
+    
+    # 2. Dangerous pattern check (before other checks)
+    if contains_dangerous_pattern(latex_string):
+        return ("Formula contains unsafe content. Dangerous patterns detected.", '')
+    
+    # 3. Command whitelist validation
+    _, blocked_commands = validate_commands(latex_string)
+    
+    if blocked_commands:
+        return (f"Command(s) not allowed: {', '.join(blocked_commands)}", '')
+    
+    # 4. Complexity checks
+    nesting_depth = count_nesting(latex_string)
+    if nesting_depth > max_nesting:
+        return (
+            f"Formula too deeply nested (max {max_nesting} levels, "
+            f"got {nesting_depth})",
+            '',
+        )
+    
+    # 5. Matrix size check
+    matrix_size = get_matrix_size(latex_string)
+    if matrix_size:
+        rows, cols = matrix_size
+        max_rows, max_cols = max_matrix_size
+        if rows > max_rows or cols > max_cols:
+            return (
+                f"Matrix too large (max {max_rows}×{max_cols}, "
+                f"got {rows}×{cols})",
+                '',
+            )
+    
+    # 6. Return the input as is. Every construct sanitize_latex() strips also
+    # matches contains_dangerous_pattern(), which came back clean in step 2,
+    # so sanitizing here would return it unchanged; skip that scan.
+    return (None, latex_string)
+
+
 def count_nesting(latex_string: str) -> int:
     r"""
     Count maximum nesting depth in LaTeX formula.
@@ -181,55 +226,29 @@ def count_nesting(latex_string: str) -> int:
     if not latex_string:
         return 0
     
+    # Only unescaped brackets affect the depth. Drop the escapes, then let
+    # bytes.translate delete everything else in C, leaving just the brackets
+    # (multi-byte UTF-8 sequences contain no ASCII bytes, so they vanish too).
+    unescaped = _ESCAPED_BRACKET_RE.sub('', latex_string)
+    brackets = unescaped.encode('utf-8', 'surrogatepass').translate(None, _NON_BRACKET_BYTES)
+    
+    # Stack of open bracket types; its height is the current depth. A
+    # bytearray sized for the worst case avoids list growth on every push.
+    stack = bytearray(len(brackets))
+    top = 0
     max_depth = 0
-    current_depth = 0
     
-    # Track different bracket types
-    brace_stack = []
-    
-    i = 0
-    while i < len(latex_string):
-        char = latex_string[i]
-        
-        # Opening braces
-        if char == '{':
-            current_depth += 1
-            brace_stack.append('{')
-            max_depth = max(max_depth, current_depth)
-        # Closing braces
-        elif char == '}':
-            if brace_stack and brace_stack[-1] == '{':
-                current_depth -= 1
-                brace_stack.pop()
-            # If mismatched, don't decrement (syntax error, but count what we can)
-        
-        # Opening parentheses
-        elif char == '(':
-            current_depth += 1
-            brace_stack.append('(')
-            max_depth = max(max_depth, current_depth)
-        # Closing parentheses
-        elif char == ')':
-            if brace_stack and brace_stack[-1] == '(':
-                current_depth -= 1
-                brace_stack.pop()
-        
-        # Opening brackets
-        elif char == '[':
-            current_depth += 1
-            brace_stack.append('[')
-            max_depth = max(max_depth, current_depth)
-        # Closing brackets
-        elif char == ']':
-            if brace_stack and brace_stack[-1] == '[':
-                current_depth -= 1
-                brace_stack.pop()
-        
-        # Skip escaped characters
-        elif char == '\\' and i + 1 < len(latex_string):
-            i += 1  # Skip next character (escaped)
-        
-        i += 1
+    for byte in brackets:
+        # Opening brace, parenthesis or bracket
+        if byte in _OPENING_BRACKETS:
+            stack[top] = byte
+            top += 1
+            if top > max_depth:
+                max_depth = top
+        # Closing: only pops its own type. If mismatched, don't decrement
+        # (syntax error, but count what we can)
+        elif top and stack[top - 1] == _MATCHING_OPENER[byte]:
+            top -= 1
     
     return max_depth
 
@@ -262,55 +281,55 @@ def get_matrix_size(latex_string: str) -> Optional[Tuple[int, int]]:
     if not latex_string:
         return None
     
-    # Matrix environment patterns
-    matrix_patterns = [
-        r'\\begin\{matrix\}',
-        r'\\begin\{pmatrix\}',
-        r'\\begin\{bmatrix\}',
-        r'\\begin\{Bmatrix\}',
-        r'\\begin\{vmatrix\}',
-        r'\\begin\{Vmatrix\}',
-        r'\\begin\{array\}',
-    ]
-    
-    for pattern in matrix_patterns:
-        # Find matrix environment
-        match = re.search(pattern, latex_string, re.IGNORECASE)
-        if match:
-            # Find corresponding \end
-            start_pos = match.end()
-            end_pattern = pattern.replace('\\begin', '\\end')
-            end_match = re.search(end_pattern, latex_string[start_pos:], re.IGNORECASE)
-            
-            if end_match:
-                # Extract matrix content
-                matrix_content = latex_string[start_pos:start_pos + end_match.start()]
-                
-                # Count rows (separated by \\)
-                rows = matrix_content.count('\\\\') + 1
-                if not matrix_content.strip():
-                    rows = 0
-                
-                # Count columns in first row (separated by &)
-                first_row_end = matrix_content.find('\\\\')
-                if first_row_end == -1:
-                    first_row = matrix_content
-                else:
-                    first_row = matrix_content[:first_row_end]
-                
-                # Count & separators + 1 for columns
-                cols = first_row.count('&') + 1
-                if not first_row.strip():
-                    cols = 0
-                
-                # Return dimensions
-                if rows > 0 and cols > 0:
-                    return (rows, cols)
+    # Dimensions of the first occurrence of each environment, found in one
+    # left-to-right scan
+    sizes = {}
+    for match in _MATRIX_BEGIN_RE.finditer(latex_string):
+        environment = match.group(1)
+        if environment in sizes:
+            continue
+        
+        # Find corresponding \end
+        start_pos = match.end()
+        end_pos = latex_string.find('\\end{' + environment + '}', start_pos)
+        sizes[environment] = (
+            None if end_pos == -1 else _matrix_dimensions(latex_string[start_pos:end_pos])
+        )
+    
+    # Environments are reported in a fixed order, not by position
+    for environment in _MATRIX_ENVIRONMENTS:
+        size = sizes.get(environment)
+        if size:
+            return size
     
     return None
 
 
-def validate_complexity(latex_string: str) -> Tuple[bool, list]:
+def _matrix_dimensions(matrix_content: str) -> Optional[Tuple[int, int]]:
+    """Count (rows, columns) of a matrix body, or None if it is empty."""
+    # Count rows (separated by \\)
+    rows = matrix_content.count('\\\\') + 1
+    if not matrix_content.strip():
+        rows = 0
+    
+    # Count columns in first row (separated by &)
+    first_row_end = matrix_content.find('\\\\')
+    if first_row_end == -1:
+        first_row = matrix_content
+    else:
+        first_row = matrix_content[:first_row_end]
+    
+    # Count & separators + 1 for columns
+    cols = first_row.count('&') + 1
+    if not first_row.strip():
+        cols = 0
+    
+    if rows > 0 and cols > 0:
+        return (rows, cols)
+    return None
+
+
+def validate_complexity(latex_string: str, fast_fail: bool = False) -> Tuple[bool, list]:
     """
     Validate formula complexity and return detailed results.
     
@@ -319,6 +338,9 @@ def validate_complexity(latex_string: str) -> Tuple[bool, list]:
     
     Args:
         latex_string: Input LaTeX string to validate
+        fast_fail: Stop at the first issue instead of collecting all of them.
+                   Checks run cheapest first, so rejected input (e.g. an
+                   oversized or unsafe formula) skips the remaining scans.
     
     Returns:
         Tuple of (is_valid, list_of_issues)
@@ -343,20 +365,25 @@ def validate_complexity(latex_string: str) -> Tuple[bool, list]:
             f"got {len(latex_string):,})"
         )
     
+    if fast_fail and issues:
+        return (False, issues)
+    
     # Dangerous pattern check
     if contains_dangerous_pattern(latex_string):
         issues.append("Formula contains unsafe content")
     
+    if fast_fail and issues:
+        return (False, issues)
+    
     # Command whitelist check
-    commands = extract_commands(latex_string)
-    blocked_commands = []
-    for cmd in commands:
-        if not is_command_allowed(cmd):
-            blocked_commands.append(cmd)
+    _, blocked_commands = validate_commands(latex_string)
     
     if blocked_commands:
         issues.append(f"Command(s) not allowed: {', '.join(blocked_commands)}")
     
+    if fast_fail and issues:
+        return (False, issues)
+    
     # Nesting depth check
     nesting_depth = count_nesting(latex_string)
     if nesting_depth > MAX_NESTING_DEPTH:
@@ -365,6 +392,9 @@ def validate_complexity(latex_string: str) -> Tuple[bool, list]:
             f"got {nesting_depth})"
         )
     
+    if fast_fail and issues:
+        return (False, issues)
+    
     # Matrix size check
     matrix_size = get_matrix_size(latex_string)
     if matrix_size:
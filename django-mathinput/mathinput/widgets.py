@@ -4,11 +4,105 @@ Django form widget for math input.
 Provides a CKEditor-style math formula editor with graphical interface,
 multiple input modes, and domain presets.
 """
+import json
+from functools import lru_cache
+
 from django import forms
 from django.conf import settings
-from django.template.loader import render_to_string
-from mathinput.modes import is_valid_mode
-from mathinput.presets import is_valid_preset
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.template.loader import get_template, render_to_string
+from mathinput.modes import VALID_MODES
+from mathinput.presets import VALID_PRESETS
+
+
+# Valid mode and preset codes, for checking constructor arguments
+_VALID_MODES = frozenset(VALID_MODES)
+_VALID_PRESETS = frozenset(VALID_PRESETS)
+
+
+# MATHINPUT_* settings already read, by name. Widgets are built and rendered
+# many times per page (formsets, changelists), so each setting is read once
+# and dropped again by _clear_settings_cache() when it changes.
+_SETTINGS_CACHE = {}
+
+
+def _get_cached_setting(name, default):
+    """
+    Get a Django setting, caching the value after the first successful read.
+    
+    Falls back to default (without caching it) when settings cannot be read,
+    e.g. when Django is not configured yet.
+    """
+    try:
+        return _SETTINGS_CACHE[name]
+    except KeyError:
+        pass
+    
+    try:
+        value = getattr(settings, name, default)
+    except ImproperlyConfigured:
+        # Django settings not configured (e.g., during import)
+        return default
+    
+    _SETTINGS_CACHE[name] = value
+    return value
+
+
+def _get_extensions_json():
+    """
+    Get MATHINPUT_KATEX_EXTENSIONS as the JSON list passed to the widget script.
+    
+    The serialized form is cached next to the setting itself (under the
+    setting name plus '_JSON'), so json.dumps runs once rather than per render.
+    """
+    try:
+        return _SETTINGS_CACHE['MATHINPUT_KATEX_EXTENSIONS_JSON']
+    except KeyError:
+        pass
+    
+    extensions = _get_cached_setting('MATHINPUT_KATEX_EXTENSIONS', [])
+    if isinstance(extensions, str):
+        # If string, convert to list
+        extensions = [ext.strip() for ext in extensions.split(',') if ext.strip()]
+    
+    extensions_json = json.dumps(extensions)
+    
+    # Only cache once the setting itself could be read
+    if 'MATHINPUT_KATEX_EXTENSIONS' in _SETTINGS_CACHE:
+        _SETTINGS_CACHE['MATHINPUT_KATEX_EXTENSIONS_JSON'] = extensions_json
+    return extensions_json
+
+
+@lru_cache(maxsize=128)
+def get_shared_widget(mode=None, preset=None):
+    """
+    Return a shared MathInputWidget for a mode and preset.
+    
+    For callers that only render the widget or hand it to a form field
+    (which deep-copies it), so one instance per configuration is enough.
+    The widget must not be modified. Defaults for a None mode or preset are
+    resolved when the widget is built, so the cache is cleared when those
+    settings change.
+    
+    Args:
+        mode: Input mode, or None for MATHINPUT_DEFAULT_MODE
+        preset: Domain preset, or None for MATHINPUT_PRESET
+    
+    Returns:
+        MathInputWidget instance shared by all callers with the same arguments
+    """
+    return MathInputWidget(mode=mode, preset=preset)
+
+
+@receiver(setting_changed)
+def _clear_settings_cache(setting, **kwargs):
+    """Forget a cached setting, and values derived from it, when it changes."""
+    _SETTINGS_CACHE.pop(setting, None)
+    _SETTINGS_CACHE.pop(setting + '_JSON', None)
+    if setting in ('MATHINPUT_DEFAULT_MODE', 'MATHINPUT_PRESET'):
+        get_shared_widget.cache_clear()
 
 
 class MathInputWidget(forms.Widget):
@@ -46,27 +140,19 @@ class MathInputWidget(forms.Widget):
         super().__init__(attrs)
         
         # Get mode from parameter, settings, or default
-        try:
-            default_mode = getattr(settings, 'MATHINPUT_DEFAULT_MODE', 'regular_functions')
-        except Exception:
-            # Django settings not configured (e.g., during import)
-            default_mode = 'regular_functions'
+        default_mode = _get_cached_setting('MATHINPUT_DEFAULT_MODE', 'regular_functions')
         
         # Validate mode - use default if invalid
-        if mode and is_valid_mode(mode):
+        if mode and mode in _VALID_MODES:
             self.mode = mode
         else:
             self.mode = default_mode
         
         # Get preset from parameter, settings, or default
-        try:
-            default_preset = getattr(settings, 'MATHINPUT_PRESET', 'algebra')
-        except Exception:
-            # Django settings not configured (e.g., during import)
-            default_preset = 'algebra'
+        default_preset = _get_cached_setting('MATHINPUT_PRESET', 'algebra')
         
         # Validate preset - use default if invalid
-        if preset and is_valid_preset(preset):
+        if preset and preset in _VALID_PRESETS:
             self.preset = preset
         else:
             self.preset = default_preset
@@ -78,6 +164,18 @@ class MathInputWidget(forms.Widget):
         }
         js = ('mathinput/js/mathinput.js',)
     
+    @property
+    def media(self):
+        """
+        Widget assets, built once from the Media declaration above.
+        
+        Django would otherwise build a new Media object on every access; all
+        instances share the same one. Subclasses declaring their own Media
+        still get it combined with these assets, and subclasses without one
+        inherit them unchanged.
+        """
+        return _WIDGET_MEDIA
+    
     def render(self, name, value, attrs=None, renderer=None):
         """
         Render the widget HTML.
@@ -91,31 +189,19 @@ class MathInputWidget(forms.Widget):
         Returns:
             Rendered HTML string
         """
-        if attrs is None:
-            attrs = {}
-        
-        # Generate unique widget ID
-        widget_id = attrs.get('id') or f'id_{name}'
-        attrs['id'] = widget_id
+        # Generate unique widget ID. The caller's attrs dict is left untouched.
+        if attrs:
+            widget_id = attrs.get('id') or f'id_{name}'
+            attrs = {**attrs, 'id': widget_id}
+        else:
+            widget_id = f'id_{name}'
+            attrs = {'id': widget_id}
         
         # Get renderer from settings
-        try:
-            renderer_type = getattr(settings, 'MATHINPUT_RENDERER', 'katex')
-        except Exception:
-            renderer_type = 'katex'
-        
-        # Get extensions from settings
-        try:
-            extensions = getattr(settings, 'MATHINPUT_KATEX_EXTENSIONS', [])
-            if isinstance(extensions, str):
-                # If string, convert to list
-                extensions = [ext.strip() for ext in extensions.split(',') if ext.strip()]
-        except Exception:
-            extensions = []
-        
-        # Convert extensions to JSON string for template
-        import json
-        extensions_json = json.dumps(extensions)
+        renderer_type = _get_cached_setting('MATHINPUT_RENDERER', 'katex')
+        
+        # Get extensions from settings, as a JSON string for the template
+        extensions_json = _get_extensions_json()
         
         # Prepare template context
         context = {
@@ -131,6 +217,42 @@ class MathInputWidget(forms.Widget):
         
         return render_to_string(self.template_name, context)
     
+    def render_many(self, items):
+        """
+        Render the widget once per (name, value) pair.
+        
+        Produces the same HTML as calling render(name, value) for each pair,
+        but looks up the template and the MATHINPUT_* settings only once,
+        which pays off for changelists and formsets with many rows.
+        
+        Args:
+            items: Iterable of (name, value) pairs
+        
+        Returns:
+            List of rendered HTML strings, in the order of items
+        """
+        template = get_template(self.template_name)
+        renderer_type = _get_cached_setting('MATHINPUT_RENDERER', 'katex')
+        extensions_json = _get_extensions_json()
+        mode = self.mode
+        preset = self.preset
+        
+        rendered = []
+        append = rendered.append
+        for name, value in items:
+            widget_id = f'id_{name}'
+            append(template.render({
+                'name': name,
+                'value': value or '',
+                'mode': mode,
+                'preset': preset,
+                'widget_id': widget_id,
+                'attrs': {'id': widget_id},
+                'renderer': renderer_type,
+                'extensions': extensions_json,
+            }))
+        return rendered
+    
     def value_from_datadict(self, data, files, name):
         """
         Extract value from form data.
@@ -145,3 +267,6 @@ class MathInputWidget(forms.Widget):
         """
         return data.get(name, '')
 
+
+# Assets of MathInputWidget, shared by all instances
+_WIDGET_MEDIA = forms.Media(MathInputWidget.Media)
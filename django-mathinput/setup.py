@@ -4,9 +4,16 @@ Setup configuration for django-mathinput package.
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read the contents of README file
 this_directory = Path(__file__).parent
-long_description = (this_directory / "README.md").read_text(encoding='utf-8') if (this_directory / "README.md").exists() else ""
+
+
+def _read_long_description():
+    """Read the contents of README file (empty if it is missing)."""
+    try:
+        return (this_directory / "README.md").read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return ""
+
 
 setup(
     name="django-mathinput",
@@ -14,7 +21,7 @@ setup(
     author="MathInput Contributors",
     author_email="mathinput@example.com",
     description="CKEditor-style math formula editor for Django templates",
-    long_description=long_description,
+    long_description=_read_long_description(),
     long_description_content_type="text/markdown",
     url="https://github.com/yourusername/django-mathinput",
     project_urls={
@@ -39,46 +39,11 @@ if not settings.configured:
 
 
 # pytest-django should automatically handle migrations, but when running from root
-# directory, it sometimes doesn't. We ensure migrations run before database tests.
-
-_migrations_run_for_session = False
-
-@pytest.hookimpl(trylast=True)
-def pytest_runtest_setup(item):
-    """
-    Ensure migrations are run before the first database test.
-    This hook runs after pytest-django's setup but before the test.
-    """
-    global _migrations_run_for_session
-    
-    # Only run for tests marked with django_db
-    if item.get_closest_marker('django_db') and not _migrations_run_for_session:
-        # Run migrations - the migrate command is idempotent, so it's safe to run multiple times
-        # We use a flag to avoid running it for every test, but we'll run it for the first one
-        try:
-            from django.db import connection
-            # Ensure connection is ready
-            connection.ensure_connection()
-            
-            # Try to use pytest-django's db_blocker if available
-            try:
-                from pytest_django.fixtures import django_db_blocker
-                with django_db_blocker.unblock():
-                    call_command('migrate', verbosity=0, interactive=False, run_syncdb=True)
-                    _migrations_run_for_session = True
-            except (ImportError, AttributeError, NameError):
-                # pytest-django fixtures not available, run migrations directly
-                call_command('migrate', verbosity=0, interactive=False, run_syncdb=True)
-                _migrations_run_for_session = True
-        except Exception:
-            # If the first attempt fails, try again without db_blocker
-            try:
-                from django.db import connection
-                connection.ensure_connection()
-                call_command('migrate', verbosity=0, interactive=False, run_syncdb=True)
-                _migrations_run_for_session = True
-            except Exception:
-                # If migrations still fail, don't set the flag so we'll try again
-                # This allows retry on the next test
-                pass
-
+# directory, it sometimes doesn't. Extend its session-scoped database setup so
+# migrations are applied once, before any database test runs.
+
+@pytest.fixture(scope='session')
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Apply migrations to the test database created by pytest-django."""
+    with django_db_blocker.unblock():
+        call_command('migrate', verbosity=0, interactive=False, run_syncdb=True)
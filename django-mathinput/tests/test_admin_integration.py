@@ -81,6 +81,23 @@ class TestMathInputAdminMixin(TestCase):
         # Check that mixin has the attribute
         assert hasattr(TestAdmin, 'mathinput_fields')
         assert TestAdmin.mathinput_fields == {'equation': {'mode': 'regular_functions', 'preset': 'algebra'}}
+    
+    def test_mixin_freezes_mathinput_fields(self):
+        """
+        What we are testing: Mixin flattens mathinput_fields when the admin class is defined
+        Why we are testing: Admin init should not re-walk the config dict on every instantiation
+        Expected Result: Frozen tuple of (field_name, mode, preset) triples on the class
+        """
+        class TestAdmin(MathInputAdminMixin, admin.ModelAdmin):
+            mathinput_fields = {
+                'equation': {'mode': 'regular_functions', 'preset': 'algebra'},
+                'notes': {'mode': 'matrices'},
+            }
+        
+        assert TestAdmin._mathinput_fields_frozen == (
+            ('equation', 'regular_functions', 'algebra'),
+            ('notes', 'matrices', None),
+        )
 
 
 @pytest.mark.integration
@@ -185,3 +202,128 @@ def test_admin_list_display_support():
     truncated = value[:10] if len(value) > 10 else value
     assert truncated is not None
 
+
+@pytest.mark.integration
+def test_admin_widgets_shared_per_configuration():
+    """
+    What we are testing: Admin widgets are built once per (mode, preset) and copied per form field
+    Why we are testing: Admin init should not rebuild identical widgets for every field
+    Expected Result: Same instance for same config; form fields get their own copy; new defaults apply
+        after the settings change
+    """
+    from django.test import override_settings
+    from mathinput.widgets import get_shared_widget
+    
+    widget = get_shared_widget('matrices', 'machine_learning')
+    
+    assert widget is get_shared_widget('matrices', 'machine_learning')
+    assert widget is not get_shared_widget('matrices', 'calculus')
+    
+    with override_settings(MATHINPUT_DEFAULT_MODE='matrices'):
+        assert get_shared_widget(None, None).mode == 'matrices'
+    assert get_shared_widget(None, None).mode == 'regular_functions'
+    
+    field = forms.CharField(widget=widget)
+    assert field.widget is not widget
+    assert field.widget.mode == 'matrices'
+    assert field.widget.preset == 'machine_learning'
+
+
+@pytest.mark.integration
+def test_admin_form_class_built_once_per_configuration():
+    """
+    What we are testing: Generated admin form classes are cached per model and field configuration
+    Why we are testing: Admin init should not create a new form class every time
+    Expected Result: Same class for same config; configured field uses MathInputWidget and current defaults
+    """
+    from django.contrib.auth.models import Group
+    from django.test import override_settings
+    from mathinput.admin import _make_form_class
+    
+    config = (('name', 'matrices', 'machine_learning'),)
+    form_class = _make_form_class(Group, config)
+    
+    assert form_class is _make_form_class(Group, config)
+    assert form_class._meta.model is Group
+    
+    with override_settings(MATHINPUT_PRESET='calculus'):
+        default_config = (('name', 'matrices', None),)
+        assert _make_form_class(Group, default_config)().fields['name'].widget.preset == 'calculus'
+    
+    widget = form_class().fields['name'].widget
+    assert isinstance(widget, MathInputWidget)
+    assert widget.mode == 'matrices'
+    assert widget.preset == 'machine_learning'
+
+
+@pytest.mark.integration
+def test_mixin_with_default_model_admin_form():
+    """
+    What we are testing: MathInputAdminMixin works with ModelAdmin's default form
+    Why we are testing: The default ModelForm has no Meta to attach widgets to
+    Expected Result: A generated form class uses MathInputWidget for configured fields
+    """
+    from django.contrib.auth.models import Group
+    
+    class GroupAdmin(MathInputAdminMixin, admin.ModelAdmin):
+        mathinput_fields = {
+            'name': {'mode': 'matrices', 'preset': 'machine_learning'},
+        }
+    
+    group_admin = GroupAdmin(Group, AdminSite())
+    widget = group_admin.form().fields['name'].widget
+    
+    assert isinstance(widget, MathInputWidget)
+    assert widget.mode == 'matrices'
+
+
+@pytest.mark.integration
+def test_mixin_with_custom_form_without_widgets():
+    """
+    What we are testing: MathInputAdminMixin adds widgets to a custom form whose Meta has none
+    Why we are testing: Custom admin forms commonly omit Meta.widgets
+    Expected Result: Meta.widgets is created and holds MathInputWidget for configured fields
+    """
+    from django.contrib.auth.models import Group
+    
+    class GroupForm(forms.ModelForm):
+        class Meta:
+            model = Group
+            fields = ['name']
+    
+    class GroupAdmin(MathInputAdminMixin, admin.ModelAdmin):
+        form = GroupForm
+        mathinput_fields = {
+            'name': {'mode': 'integrals_differentials', 'preset': 'calculus'},
+        }
+    
+    GroupAdmin(Group, AdminSite())
+    
+    assert isinstance(GroupForm.Meta.widgets['name'], MathInputWidget)
+    assert GroupForm.Meta.widgets['name'].mode == 'integrals_differentials'
+
+
+@pytest.mark.integration
+def test_admin_form_subclass_attaches_widgets():
+    """
+    What we are testing: MathInputAdminForm subclasses get widgets from mathinput_fields at definition
+    Why we are testing: Form specialization should run once per subclass, not per admin init
+    Expected Result: Configured field uses MathInputWidget; other declared widgets are kept
+    """
+    from django.contrib.auth.models import Group
+    
+    class GroupAdminForm(MathInputAdminForm):
+        mathinput_fields = {
+            'name': {'mode': 'statistics_probability', 'preset': 'statistics'},
+        }
+        
+        class Meta:
+            model = Group
+            fields = ['name', 'permissions']
+            widgets = {'permissions': forms.CheckboxSelectMultiple()}
+    
+    form = GroupAdminForm()
+    
+    assert isinstance(form.fields['name'].widget, MathInputWidget)
+    assert form.fields['name'].widget.mode == 'statistics_probability'
+    assert isinstance(form.fields['permissions'].widget, forms.CheckboxSelectMultiple)
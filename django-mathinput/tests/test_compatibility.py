@@ -183,43 +183,39 @@ class TestCrossVersionCompatibility:
         display_html = render_math(r'\frac{1}{2}')
         assert display_html is not None
     
-    def test_all_modes_work(self):
+    @pytest.mark.parametrize('mode', [
+        'regular_functions',
+        'advanced_expressions',
+        'integrals_differentials',
+        'matrices',
+        'statistics_probability',
+        'physics_engineering',
+    ])
+    def test_all_modes_work(self, mode):
         """
         What we are testing: All modes work across versions
         Why we are testing: Compatibility - modes should work on all versions
         Expected Result: All modes render correctly
         """
-        modes = [
-            'regular_functions',
-            'advanced_expressions',
-            'integrals_differentials',
-            'matrices',
-            'statistics_probability',
-            'physics_engineering',
-        ]
-        
-        for mode in modes:
-            widget = MathInputWidget(mode=mode)
-            html = widget.render('equation', r'\frac{1}{2}')
-            assert html is not None
+        widget = MathInputWidget(mode=mode)
+        html = widget.render('equation', r'\frac{1}{2}')
+        assert html is not None
     
-    def test_all_presets_work(self):
+    @pytest.mark.parametrize('preset', [
+        'algebra',
+        'calculus',
+        'physics',
+        'machine_learning',
+        'statistics',
+        'probability',
+    ])
+    def test_all_presets_work(self, preset):
         """
         What we are testing: All presets work across versions
         Why we are testing: Compatibility - presets should work on all versions
         Expected Result: All presets render correctly
         """
-        presets = [
-            'algebra',
-            'calculus',
-            'physics',
-            'machine_learning',
-            'statistics',
-            'probability',
-        ]
-        
-        for preset in presets:
-            widget = MathInputWidget(preset=preset)
-            html = widget.render('equation', r'\frac{1}{2}')
-            assert html is not None
+        widget = MathInputWidget(preset=preset)
+        html = widget.render('equation', r'\frac{1}{2}')
+        assert html is not None
 
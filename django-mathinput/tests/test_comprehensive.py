@@ -5,28 +5,18 @@ Tests complete workflows, all modes, and all presets to ensure
 everything works together correctly.
 """
 import pytest
-import os
-import django
-from django.conf import settings
-from django.test import TestCase, Client
 from django import forms
-from django.contrib.auth.models import User
-
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
 
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import MathInputValidator
 from mathinput.security import sanitize_latex
-from mathinput.modes import load_mode, is_valid_mode
-from mathinput.presets import load_preset, is_valid_preset
+from mathinput.modes import load_mode, is_valid_mode, VALID_MODES
+from mathinput.presets import load_preset, is_valid_preset, VALID_PRESETS
 from mathinput.templatetags.mathinput_tags import as_mathinput, render_math
 
 
 @pytest.mark.comprehensive
-class TestEndToEndWorkflow(TestCase):
+class TestEndToEndWorkflow:
     """
     What we are testing: Complete end-to-end workflow from widget to storage
     Why we are testing: Ensure all components work together correctly
@@ -121,74 +111,27 @@ class TestAllModesFunctional:
     Expected Result: Each mode renders and functions correctly
     """
     
-    def test_regular_functions_mode(self):
-        """Test regular_functions mode."""
-        widget = MathInputWidget(mode='regular_functions')
-        assert widget.mode == 'regular_functions'
-        
-        html = widget.render('equation', r'\frac{1}{2}')
+    @pytest.mark.parametrize('mode, latex', [
+        ('regular_functions', r'\frac{1}{2}'),
+        ('advanced_expressions', r'\frac{\sqrt{x}}{2}'),
+        ('integrals_differentials', r'\int_{0}^{1} f(x) dx'),
+        ('matrices', r'\begin{pmatrix} a & b \\ c & d \end{pmatrix}'),
+        ('statistics_probability', r'\sum_{i=1}^{n} x_i'),
+        ('physics_engineering', r'F = ma'),
+    ])
+    def test_mode_functional(self, mode, latex):
+        """Test that each mode renders a typical formula and has a config."""
+        widget = MathInputWidget(mode=mode)
+        assert widget.mode == mode
+        
+        html = widget.render('equation', latex)
         assert html is not None
         
         # Verify mode config exists
-        mode_config = load_mode('regular_functions')
+        mode_config = load_mode(mode)
         assert mode_config is not None
         assert 'name' in mode_config  # Config has name field
     
-    def test_advanced_expressions_mode(self):
-        """Test advanced_expressions mode."""
-        widget = MathInputWidget(mode='advanced_expressions')
-        assert widget.mode == 'advanced_expressions'
-        
-        html = widget.render('equation', r'\frac{\sqrt{x}}{2}')
-        assert html is not None
-        
-        mode_config = load_mode('advanced_expressions')
-        assert mode_config is not None
-    
-    def test_integrals_differentials_mode(self):
-        """Test integrals_differentials mode."""
-        widget = MathInputWidget(mode='integrals_differentials')
-        assert widget.mode == 'integrals_differentials'
-        
-        html = widget.render('equation', r'\int_{0}^{1} f(x) dx')
-        assert html is not None
-        
-        mode_config = load_mode('integrals_differentials')
-        assert mode_config is not None
-    
-    def test_matrices_mode(self):
-        """Test matrices mode."""
-        widget = MathInputWidget(mode='matrices')
-        assert widget.mode == 'matrices'
-        
-        html = widget.render('equation', r'\begin{pmatrix} a & b \\ c & d \end{pmatrix}')
-        assert html is not None
-        
-        mode_config = load_mode('matrices')
-        assert mode_config is not None
-    
-    def test_statistics_probability_mode(self):
-        """Test statistics_probability mode."""
-        widget = MathInputWidget(mode='statistics_probability')
-        assert widget.mode == 'statistics_probability'
-        
-        html = widget.render('equation', r'\sum_{i=1}^{n} x_i')
-        assert html is not None
-        
-        mode_config = load_mode('statistics_probability')
-        assert mode_config is not None
-    
-    def test_physics_engineering_mode(self):
-        """Test physics_engineering mode."""
-        widget = MathInputWidget(mode='physics_engineering')
-        assert widget.mode == 'physics_engineering'
-        
-        html = widget.render('equation', r'F = ma')
-        assert html is not None
-        
-        mode_config = load_mode('physics_engineering')
-        assert mode_config is not None
-    
     def test_all_modes_valid(self):
         """Test that all modes are valid."""
         all_modes = [
@@ -200,10 +143,9 @@ class TestAllModesFunctional:
             'physics_engineering',
         ]
         
+        assert set(all_modes) == set(VALID_MODES)
         for mode in all_modes:
             assert is_valid_mode(mode), f"Mode {mode} should be valid"
-            widget = MathInputWidget(mode=mode)
-            assert widget.mode == mode
 
 
 @pytest.mark.comprehensive
@@ -214,73 +156,26 @@ class TestAllPresetsFunctional:
     Expected Result: Each preset loads and applies correctly
     """
     
-    def test_algebra_preset(self):
-        """Test algebra preset."""
-        widget = MathInputWidget(preset='algebra')
-        assert widget.preset == 'algebra'
-        
-        html = widget.render('equation', r'x^2 + y^2')
+    @pytest.mark.parametrize('preset, latex', [
+        ('algebra', r'x^2 + y^2'),
+        ('calculus', r'\int f(x) dx'),
+        ('physics', r'E = mc^2'),
+        ('machine_learning', r'\mathbf{X} = \begin{pmatrix} x_1 \\ x_2 \end{pmatrix}'),
+        ('statistics', r'\bar{x} = \frac{1}{n}\sum_{i=1}^{n} x_i'),
+        ('probability', r'P(A \cap B) = P(A) \cdot P(B)'),
+    ])
+    def test_preset_functional(self, preset, latex):
+        """Test that each preset renders a typical formula and has a config."""
+        widget = MathInputWidget(preset=preset)
+        assert widget.preset == preset
+        
+        html = widget.render('equation', latex)
         assert html is not None
         
-        preset_config = load_preset('algebra')
+        preset_config = load_preset(preset)
         assert preset_config is not None
         assert 'name' in preset_config  # Config has name field
     
-    def test_calculus_preset(self):
-        """Test calculus preset."""
-        widget = MathInputWidget(preset='calculus')
-        assert widget.preset == 'calculus'
-        
-        html = widget.render('equation', r'\int f(x) dx')
-        assert html is not None
-        
-        preset_config = load_preset('calculus')
-        assert preset_config is not None
-    
-    def test_physics_preset(self):
-        """Test physics preset."""
-        widget = MathInputWidget(preset='physics')
-        assert widget.preset == 'physics'
-        
-        html = widget.render('equation', r'E = mc^2')
-        assert html is not None
-        
-        preset_config = load_preset('physics')
-        assert preset_config is not None
-    
-    def test_machine_learning_preset(self):
-        """Test machine_learning preset."""
-        widget = MathInputWidget(preset='machine_learning')
-        assert widget.preset == 'machine_learning'
-        
-        html = widget.render('equation', r'\mathbf{X} = \begin{pmatrix} x_1 \\ x_2 \end{pmatrix}')
-        assert html is not None
-        
-        preset_config = load_preset('machine_learning')
-        assert preset_config is not None
-    
-    def test_statistics_preset(self):
-        """Test statistics preset."""
-        widget = MathInputWidget(preset='statistics')
-        assert widget.preset == 'statistics'
-        
-        html = widget.render('equation', r'\bar{x} = \frac{1}{n}\sum_{i=1}^{n} x_i')
-        assert html is not None
-        
-        preset_config = load_preset('statistics')
-        assert preset_config is not None
-    
-    def test_probability_preset(self):
-        """Test probability preset."""
-        widget = MathInputWidget(preset='probability')
-        assert widget.preset == 'probability'
-        
-        html = widget.render('equation', r'P(A \cap B) = P(A) \cdot P(B)')
-        assert html is not None
-        
-        preset_config = load_preset('probability')
-        assert preset_config is not None
-    
     def test_all_presets_valid(self):
         """Test that all presets are valid."""
         all_presets = [
@@ -292,27 +187,24 @@ class TestAllPresetsFunctional:
             'probability',
         ]
         
+        assert set(all_presets) == set(VALID_PRESETS)
         for preset in all_presets:
             assert is_valid_preset(preset), f"Preset {preset} should be valid"
-            widget = MathInputWidget(preset=preset)
-            assert widget.preset == preset
     
-    def test_mode_preset_combinations(self):
+    @pytest.mark.parametrize('mode, preset', [
+        ('regular_functions', 'algebra'),
+        ('integrals_differentials', 'calculus'),
+        ('matrices', 'machine_learning'),
+        ('statistics_probability', 'statistics'),
+        ('statistics_probability', 'probability'),
+        ('physics_engineering', 'physics'),
+    ])
+    def test_mode_preset_combinations(self, mode, preset):
         """Test that mode and preset combinations work."""
-        combinations = [
-            ('regular_functions', 'algebra'),
-            ('integrals_differentials', 'calculus'),
-            ('matrices', 'machine_learning'),
-            ('statistics_probability', 'statistics'),
-            ('statistics_probability', 'probability'),
-            ('physics_engineering', 'physics'),
-        ]
+        widget = MathInputWidget(mode=mode, preset=preset)
+        assert widget.mode == mode
+        assert widget.preset == preset
         
-        for mode, preset in combinations:
-            widget = MathInputWidget(mode=mode, preset=preset)
-            assert widget.mode == mode
-            assert widget.preset == preset
-            
-            html = widget.render('equation', r'\frac{1}{2}')
-            assert html is not None
+        html = widget.render('equation', r'\frac{1}{2}')
+        assert html is not None
 
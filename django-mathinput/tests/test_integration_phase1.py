@@ -5,17 +5,9 @@ Tests the integration of MathInputWidget with Django forms,
 ensuring the widget works correctly in real form contexts.
 """
 import pytest
-import os
-import django
 from django import forms
-from django.conf import settings
 from django.core.exceptions import ValidationError
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import MathInputValidator
 
@@ -4,9 +4,7 @@ Integration tests for Phase 2: Mode and Preset systems integration.
 Tests mode and preset systems working together in widget context.
 """
 import pytest
-from django.test import TestCase
 from django import forms
-from django.template.loader import render_to_string
 from mathinput.widgets import MathInputWidget
 from mathinput.modes import load_mode, VALID_MODES
 from mathinput.presets import load_preset, VALID_PRESETS
@@ -18,7 +16,7 @@ class MathForm(forms.Form):
 
 
 @pytest.mark.integration
-class TestModePresetIntegration(TestCase):
+class TestModePresetIntegration:
     """
     What we are testing: Mode and preset systems work together in widget
     Why we are testing: Widget must correctly combine mode and preset configurations
@@ -63,26 +61,24 @@ class TestModePresetIntegration(TestCase):
         assert 'data-mode="matrices"' in html
         assert 'data-preset="machine_learning"' in html
     
-    def test_widget_with_all_mode_combinations(self):
+    # Test a few key combinations
+    @pytest.mark.parametrize('mode_code, preset_code', [
+        ('regular_functions', 'algebra'),
+        ('integrals_differentials', 'calculus'),
+        ('matrices', 'machine_learning'),
+        ('statistics_probability', 'statistics'),
+    ])
+    def test_widget_with_all_mode_combinations(self, mode_code, preset_code):
         """
         What we are testing: Widget works with all valid mode/preset combinations
         Why we are testing: All combinations should be valid and functional
         Expected Result: All combinations render without errors
         """
-        # Test a few key combinations
-        combinations = [
-            ('regular_functions', 'algebra'),
-            ('integrals_differentials', 'calculus'),
-            ('matrices', 'machine_learning'),
-            ('statistics_probability', 'statistics'),
-        ]
+        widget = MathInputWidget(mode=mode_code, preset=preset_code)
+        html = widget.render('equation', '')
         
-        for mode_code, preset_code in combinations:
-            widget = MathInputWidget(mode=mode_code, preset=preset_code)
-            html = widget.render('equation', '')
-            
-            assert f'data-mode="{mode_code}"' in html
-            assert f'data-preset="{preset_code}"' in html
+        assert f'data-mode="{mode_code}"' in html
+        assert f'data-preset="{preset_code}"' in html
     
     def test_form_with_mode_and_preset(self):
         """
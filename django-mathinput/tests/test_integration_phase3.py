@@ -5,13 +5,12 @@ Tests integration of Phase 3 features with widget and other systems.
 """
 import pytest
 from django import forms
-from django.test import TestCase
 from mathinput.widgets import MathInputWidget
 from mathinput.presets import load_preset
 
 
 @pytest.mark.integration
-class TestQuickInsertIntegration(TestCase):
+class TestQuickInsertIntegration:
     """
     What we are testing: Quick insert integrates with widget and preset system
     Why we are testing: Quick insert must work correctly in full widget context
@@ -42,7 +41,7 @@ class TestQuickInsertIntegration(TestCase):
 
 
 @pytest.mark.integration
-class TestModeSwitchingIntegration(TestCase):
+class TestModeSwitchingIntegration:
     """
     What we are testing: Mode switching integrates with widget and preserves formula
     Why we are testing: Mode switching must work without data loss
@@ -71,7 +70,7 @@ class TestModeSwitchingIntegration(TestCase):
 
 
 @pytest.mark.integration
-class TestTextFormattingIntegration(TestCase):
+class TestTextFormattingIntegration:
     """
     What we are testing: Text formatting integrates with widget
     Why we are testing: Formatting must work in full widget context
@@ -92,7 +91,7 @@ class TestTextFormattingIntegration(TestCase):
 
 
 @pytest.mark.integration
-class TestSourceModeIntegration(TestCase):
+class TestSourceModeIntegration:
     """
     What we are testing: Source mode integrates with widget
     Why we are testing: Source mode must work in full widget context
@@ -136,7 +135,7 @@ def test_quick_insert_preset_integration():
 
 
 @pytest.mark.integration
-class TestRendererIntegration(TestCase):
+class TestRendererIntegration:
     """
     What we are testing: Renderer system integrates with widget
     Why we are testing: Renderer must work in full widget context
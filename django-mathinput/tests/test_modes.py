@@ -3,6 +3,8 @@ Unit tests for mode system.
 
 Tests mode loading, validation, and configuration structure.
 """
+from collections.abc import Mapping
+
 import pytest
 from mathinput.modes import (
     load_mode,
@@ -17,21 +19,21 @@ def test_get_mode_returns_valid_structure():
     """
     What we are testing: get_mode() returns valid mode configuration structure
     Why we are testing: Mode system must provide consistent configuration format
-    Expected Result: Dictionary with required keys: name, code, toolbars, button_layout
+    Expected Result: Mapping with required keys: name, code, toolbars, button_layout
     """
     from mathinput.modes.regular_functions import get_mode
     
     mode = get_mode()
     
-    assert isinstance(mode, dict)
+    assert isinstance(mode, Mapping)
     assert 'name' in mode
     assert 'code' in mode
     assert 'toolbars' in mode
     assert 'button_layout' in mode
     assert isinstance(mode['name'], str)
     assert isinstance(mode['code'], str)
-    assert isinstance(mode['toolbars'], dict)
-    assert isinstance(mode['button_layout'], dict)
+    assert isinstance(mode['toolbars'], Mapping)
+    assert isinstance(mode['button_layout'], Mapping)
 
 
 @pytest.mark.unit
@@ -60,8 +62,8 @@ def test_mode_toolbar_visibility():
     
     assert 'visible' in mode['toolbars']
     assert 'hidden' in mode['toolbars']
-    assert isinstance(mode['toolbars']['visible'], list)
-    assert isinstance(mode['toolbars']['hidden'], list)
+    assert isinstance(mode['toolbars']['visible'], tuple)
+    assert isinstance(mode['toolbars']['hidden'], tuple)
     assert len(mode['toolbars']['visible']) > 0
 
 
@@ -123,11 +125,11 @@ def test_get_all_modes():
     """
     What we are testing: get_all_modes() returns all mode configurations
     Why we are testing: Need to retrieve all available modes
-    Expected Result: Dictionary with all 6 modes, each with valid structure
+    Expected Result: Mapping with all 6 modes, each with valid structure
     """
     all_modes = get_all_modes()
     
-    assert isinstance(all_modes, dict)
+    assert isinstance(all_modes, Mapping)
     assert len(all_modes) == 6
     
     for mode_code, mode_config in all_modes.items():
@@ -147,10 +149,62 @@ def test_mode_quick_inserts_structure():
     mode = load_mode('regular_functions')
     
     if 'quick_inserts' in mode:
-        assert isinstance(mode['quick_inserts'], list)
+        assert isinstance(mode['quick_inserts'], tuple)
         for insert in mode['quick_inserts']:
             assert isinstance(insert, (tuple, list))
             assert len(insert) == 2
             assert isinstance(insert[0], str)  # Label
             assert isinstance(insert[1], str)  # LaTeX template
 
+
+@pytest.mark.unit
+def test_load_mode_is_cached():
+    """
+    What we are testing: load_mode() returns the same cached configuration on repeated calls
+    Why we are testing: Mode configs are static, so rebuilding them per lookup is wasted work
+    Expected Result: Repeated calls with the same code return the identical object
+    """
+    assert load_mode('matrices') is load_mode('matrices')
+
+
+@pytest.mark.unit
+def test_mode_config_is_read_only():
+    """
+    What we are testing: Mode configurations cannot be mutated by callers
+    Why we are testing: Configs are shared between all callers, so mutation would leak across requests
+    Expected Result: Item assignment raises TypeError at every level
+    """
+    mode = load_mode('regular_functions')
+    
+    with pytest.raises(TypeError):
+        mode['name'] = 'Changed'
+    with pytest.raises(TypeError):
+        mode['toolbars']['visible'] = ('text',)
+    with pytest.raises(TypeError):
+        get_all_modes()['matrices'] = mode
+
+
+@pytest.mark.unit
+def test_mode_modules_share_data_table():
+    """
+    What we are testing: Per-mode get_mode() shims return the same config as load_mode()
+    Why we are testing: Mode configs now live in one data table; the old modules must stay compatible
+    Expected Result: Both access paths return the identical object
+    """
+    from mathinput.modes.matrices import get_mode
+    
+    assert get_mode() is load_mode('matrices')
+
+
+@pytest.mark.unit
+def test_legacy_mode_getters_resolve_lazily():
+    """
+    What we are testing: Legacy get_<mode> names on mathinput.modes still resolve
+    Why we are testing: Per-mode modules are imported on demand instead of with the package
+    Expected Result: Legacy getter returns the mode config; unknown names raise AttributeError
+    """
+    import mathinput.modes as modes
+    
+    assert modes.get_matrices() is load_mode('matrices')
+    with pytest.raises(AttributeError):
+        modes.get_unknown_mode
@@ -6,14 +6,6 @@ initial load time, and large formula handling.
 """
 import pytest
 import time
-import os
-import django
-from django.conf import settings
-
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
 
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import MathInputValidator
@@ -211,6 +203,46 @@ class TestLargeFormulaHandling:
         # Should complete in reasonable time
         assert elapsed < 1000, f"Matrix validation took {elapsed:.2f}ms"
     
+    def test_pathological_input_scanning_speed(self):
+        """
+        What we are testing: Security scans stay fast on inputs crafted to cause regex backtracking
+        Why we are testing: Performance/Security - unbounded patterns backtrack quadratically (ReDoS)
+        Expected Result: Detection and sanitization of 10k-character inputs each take < 200ms
+        """
+        from mathinput.security import contains_dangerous_pattern
+        
+        attacks = [
+            '<' * 10000,
+            ' ' * 9998 + 'on',
+            'on' * 5000,
+            '\\href{' * 1600,
+        ]
+        
+        for attack in attacks:
+            start = time.perf_counter()
+            contains_dangerous_pattern(attack)
+            sanitize_latex(attack)
+            elapsed = (time.perf_counter() - start) * 1000
+            
+            assert elapsed < 200, f"Scanning {attack[:10]!r}... took {elapsed:.2f}ms"
+    
+    def test_nested_dangerous_input_sanitizing_speed(self):
+        """
+        What we are testing: sanitize_latex stays fast when each removal splices a new match together
+        Why we are testing: Performance/Security - re-scanning once per nested layer is quadratic
+        Expected Result: 2000 nested '\\def' layers are handled in < 200ms and nothing dangerous is left
+        """
+        from mathinput.security import contains_dangerous_pattern
+        
+        attack = '\\de' * 2000 + 'f' * 2000
+        
+        start = time.perf_counter()
+        sanitized = sanitize_latex(attack)
+        elapsed = (time.perf_counter() - start) * 1000
+        
+        assert elapsed < 200, f"Sanitizing nested input took {elapsed:.2f}ms"
+        assert not contains_dangerous_pattern(sanitized)
+    
     def test_widget_with_large_formula_rendering(self):
         """
         What we are testing: Widget renders large formulas efficiently
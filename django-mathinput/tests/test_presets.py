@@ -3,6 +3,8 @@ Unit tests for preset system.
 
 Tests preset loading, validation, and configuration structure.
 """
+from collections.abc import Mapping
+
 import pytest
 from mathinput.presets import (
     load_preset,
@@ -17,19 +19,19 @@ def test_get_preset_returns_valid_structure():
     """
     What we are testing: get_preset() returns valid preset configuration structure
     Why we are testing: Preset system must provide consistent configuration format
-    Expected Result: Dictionary with required keys: name, code, tab_order, quick_inserts
+    Expected Result: Mapping with required keys: name, code, tab_order, quick_inserts
     """
     from mathinput.presets.algebra import get_preset
     
     preset = get_preset()
     
-    assert isinstance(preset, dict)
+    assert isinstance(preset, Mapping)
     assert 'name' in preset
     assert 'code' in preset
     assert 'tab_order' in preset
     assert isinstance(preset['name'], str)
     assert isinstance(preset['code'], str)
-    assert isinstance(preset['tab_order'], list)
+    assert isinstance(preset['tab_order'], tuple)
 
 
 @pytest.mark.unit
@@ -57,7 +59,7 @@ def test_preset_tab_order_valid():
     preset = load_preset('calculus')
     
     assert 'tab_order' in preset
-    assert isinstance(preset['tab_order'], list)
+    assert isinstance(preset['tab_order'], tuple)
     
     # Valid toolbar names
     valid_toolbars = {
@@ -79,7 +81,7 @@ def test_preset_quick_inserts_valid_latex():
     preset = load_preset('calculus')
     
     if 'quick_inserts' in preset:
-        assert isinstance(preset['quick_inserts'], list)
+        assert isinstance(preset['quick_inserts'], tuple)
         for insert in preset['quick_inserts']:
             assert isinstance(insert, (tuple, list))
             assert len(insert) == 2
@@ -147,11 +149,11 @@ def test_get_all_presets():
     """
     What we are testing: get_all_presets() returns all preset configurations
     Why we are testing: Need to retrieve all available presets
-    Expected Result: Dictionary with all 6 presets, each with valid structure
+    Expected Result: Mapping with all 6 presets, each with valid structure
     """
     all_presets = get_all_presets()
     
-    assert isinstance(all_presets, dict)
+    assert isinstance(all_presets, Mapping)
     assert len(all_presets) == 6
     
     for preset_code, preset_config in all_presets.items():
@@ -166,12 +168,64 @@ def test_preset_highlight_buttons_structure():
     """
     What we are testing: Preset highlight_buttons have correct structure (if present)
     Why we are testing: Highlight buttons must be a list of button identifiers
-    Expected Result: highlight_buttons is a list of strings (if present)
+    Expected Result: highlight_buttons is a tuple of strings (if present)
     """
     preset = load_preset('machine_learning')
     
     if 'highlight_buttons' in preset:
-        assert isinstance(preset['highlight_buttons'], list)
+        assert isinstance(preset['highlight_buttons'], tuple)
         for button in preset['highlight_buttons']:
             assert isinstance(button, str)
 
+
+@pytest.mark.unit
+def test_load_preset_is_cached():
+    """
+    What we are testing: load_preset() returns the same cached configuration on repeated calls
+    Why we are testing: Preset configs are static, so rebuilding them per lookup is wasted work
+    Expected Result: Repeated calls with the same code return the identical object
+    """
+    assert load_preset('calculus') is load_preset('calculus')
+
+
+@pytest.mark.unit
+def test_preset_config_is_read_only():
+    """
+    What we are testing: Preset configurations cannot be mutated by callers
+    Why we are testing: Configs are shared between all callers, so mutation would leak across requests
+    Expected Result: Item assignment raises TypeError
+    """
+    preset = load_preset('algebra')
+    
+    with pytest.raises(TypeError):
+        preset['name'] = 'Changed'
+    with pytest.raises(TypeError):
+        preset['quick_inserts'][0] = ('Changed', 'x')
+    with pytest.raises(TypeError):
+        get_all_presets()['calculus'] = preset
+
+
+@pytest.mark.unit
+def test_preset_modules_share_data_table():
+    """
+    What we are testing: Per-preset get_preset() shims return the same config as load_preset()
+    Why we are testing: Preset configs now live in one data table; the old modules must stay compatible
+    Expected Result: Both access paths return the identical object
+    """
+    from mathinput.presets.physics import get_preset
+    
+    assert get_preset() is load_preset('physics')
+
+
+@pytest.mark.unit
+def test_legacy_preset_getters_resolve_lazily():
+    """
+    What we are testing: Legacy get_<preset> names on mathinput.presets still resolve
+    Why we are testing: Per-preset modules are imported on demand instead of with the package
+    Expected Result: Legacy getter returns the preset config; unknown names raise AttributeError
+    """
+    import mathinput.presets as presets
+    
+    assert presets.get_calculus() is load_preset('calculus')
+    with pytest.raises(AttributeError):
+        presets.get_unknown_preset
@@ -8,18 +8,12 @@ Tests to verify package works in production-like environment:
 """
 import pytest
 import os
-import django
 from django.test import TestCase, override_settings
 from django.conf import settings
 from django.contrib.staticfiles import finders
 from django.template.loader import render_to_string
 from django import forms
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.widgets import MathInputWidget
 from mathinput.templatetags.mathinput_tags import render_math
 
@@ -17,7 +17,7 @@ def test_quick_insert_templates_loaded():
     preset = load_preset('calculus')
     
     assert 'quick_inserts' in preset
-    assert isinstance(preset['quick_inserts'], list)
+    assert isinstance(preset['quick_inserts'], tuple)
     assert len(preset['quick_inserts']) > 0
     
     # Check that templates are tuples of (name, latex)
@@ -15,6 +15,7 @@ sys.path.insert(0, str(package_dir))
 from mathinput.security import (
     sanitize_latex,
     extract_commands,
+    iter_commands,
     contains_dangerous_pattern,
     is_command_allowed,
     validate_commands,
@@ -154,3 +155,116 @@ def test_validate_commands():
     assert not is_valid, "Should be invalid"
     assert 'input' in blocked, "Should detect input as blocked"
 
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_sanitize_removes_spliced_dangerous_commands():
+    """
+    What we are testing: sanitize_latex removes commands reassembled by an earlier removal
+    Why we are testing: Security - '<scr\\defipt' must not turn into '<script' after sanitizing
+    Expected Result: No dangerous pattern remains in the sanitized output
+    """
+    for attack in [r'<scr\defipt>', r'\inp\defut{file}', r'java\defscript:alert(1)']:
+        result = sanitize_latex(attack)
+        assert not contains_dangerous_pattern(result), f"Spliced pattern survived: {result!r}"
+
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_sanitize_removes_whole_href_and_tags():
+    """
+    What we are testing: sanitize_latex removes a javascript: href and whole tags, not just their prefixes
+    Why we are testing: Security - leftover fragments of a removed construct should not reach the output
+    Expected Result: Only the safe LaTeX content remains
+    """
+    assert sanitize_latex(r'\href{javascript:alert(1)}{x}') == '{x}'
+    assert sanitize_latex('<b onclick="x">\\frac{1}{2}</b>') == r'\frac{1}{2}'
+
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_long_tags_and_attributes_are_not_cut_off():
+    """
+    What we are testing: Tags, event handlers and href targets are matched whatever their length
+    Why we are testing: Security - padding a tag or attribute must not move it out of reach of the scanner
+    Expected Result: A 600+ character tag, event name and href target are all detected and stripped
+    """
+    long_tag = '<object data="data:text/html;base64,' + 'A' * 600 + '">'
+    assert contains_dangerous_pattern(long_tag) is True
+    assert sanitize_latex(long_tag + r'\frac{1}{2}') == r'\frac{1}{2}'
+    
+    long_event = 'x on' + 'a' * 600 + '="alert(1)"'
+    assert contains_dangerous_pattern(long_event) is True
+    assert sanitize_latex(long_event) == 'x'
+    
+    long_href = r'\href{' + 'a' * 600 + 'javascript:alert(1)}{x}'
+    assert contains_dangerous_pattern(long_href) is True
+    assert sanitize_latex(long_href) == '{x}'
+
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_dangerous_check_not_bypassed_by_case_folding():
+    """
+    What we are testing: Non-ASCII letters that fold onto ASCII still trigger detection
+    Why we are testing: Security - the cheap prefilter must not skip inputs the regex would match
+    Expected Result: '\\ınput{...}' (dotless i) is detected and stripped like '\\input{...}'
+    """
+    attack = '\\ınput{/etc/passwd}'
+    assert contains_dangerous_pattern(attack) is True
+    assert not contains_dangerous_pattern(sanitize_latex(attack))
+
+
+@pytest.mark.unit
+def test_iter_commands_yields_unique_in_order():
+    """
+    What we are testing: iter_commands yields each command once, in order of first appearance
+    Why we are testing: Callers can stop at the first blocked command without scanning the rest
+    Expected Result: Same commands as extract_commands, deduplicated and ordered
+    """
+    latex = r'\sqrt{x} + \frac{1}{\sqrt{2}} + \alpha'
+    assert list(iter_commands(latex)) == ['sqrt', 'frac', 'alpha']
+    assert sorted(iter_commands(latex)) == sorted(extract_commands(latex))
+    assert list(iter_commands('')) == []
+
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_command_lists_are_immutable_and_consistent():
+    """
+    What we are testing: Command whitelist/blacklist are frozen and consistent with case-insensitive lookup
+    Why we are testing: is_command_allowed skips normalization for exact whitelist hits, which is only
+        equivalent if every entry's lowercase form is whitelisted and never blocked
+    Expected Result: frozensets; lowercase forms of allowed entries are allowed and not blocked
+    """
+    assert isinstance(ALLOWED_COMMANDS, frozenset)
+    assert isinstance(BLOCKED_COMMANDS, frozenset)
+    
+    blocked_lower = {cmd.lower() for cmd in BLOCKED_COMMANDS}
+    for cmd in ALLOWED_COMMANDS:
+        assert cmd.lower() in ALLOWED_COMMANDS, f"{cmd!r} has no lowercase whitelist entry"
+        assert cmd.lower() not in blocked_lower, f"{cmd!r} is both allowed and blocked"
+    
+    assert is_command_allowed('Gamma') is True
+    assert is_command_allowed('INPUT') is False
+
+
+@pytest.mark.unit
+@pytest.mark.security
+def test_sanitize_is_noop_when_nothing_dangerous():
+    """
+    What we are testing: sanitize_latex leaves input unchanged whenever contains_dangerous_pattern is False
+    Why we are testing: MathInputValidator skips sanitizing input that passed the dangerous-pattern check
+    Expected Result: No random mix of benign and dangerous fragments is both undetected and altered
+    """
+    import random
+    
+    fragments = [
+        r'\frac{1}{2}', r'\href{', 'javascript:', '<', '>', '<b>', 'on', 'onclick', '=', '"', "'",
+        ' ', '\n', '{', '}', r'\input', r'\def', 'x', r'\text{function}', 'ı', r'\ınput',
+    ]
+    rng = random.Random(0)
+    for _ in range(2000):
+        latex = ''.join(rng.choice(fragments) for _ in range(rng.randint(1, 12)))
+        if not contains_dangerous_pattern(latex):
+            assert sanitize_latex(latex) == latex, f"Undetected input altered: {latex!r}"
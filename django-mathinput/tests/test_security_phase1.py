@@ -5,16 +5,8 @@ Tests security features including XSS prevention, command injection prevention,
 and DoS prevention mechanisms.
 """
 import pytest
-import os
-import django
-from django.conf import settings
 from django.core.exceptions import ValidationError
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.security import sanitize_latex, contains_dangerous_pattern
 from mathinput.validators import MathInputValidator
 
@@ -112,7 +112,7 @@ def test_renderer_cdn_uses_sri():
 
 
 @pytest.mark.security
-@pytest.mark.django_db(transaction=True)
+@pytest.mark.django_db
 def test_admin_integration_requires_permissions():
     """
     What we are testing: Admin integration respects Django permissions
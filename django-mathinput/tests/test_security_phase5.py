@@ -9,19 +9,11 @@ Comprehensive security testing including:
 - Security audit validation
 """
 import pytest
-import os
-import django
-from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.test import TestCase, Client
 from django.template import Context, Template
 from django.contrib.auth.models import User
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.security import (
     sanitize_latex,
     contains_dangerous_pattern,
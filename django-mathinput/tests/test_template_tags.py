@@ -5,8 +5,13 @@ Tests the as_mathinput and render_math template filters.
 """
 import pytest
 from django.template import Context, Template
-from django.test import TestCase
-from mathinput.templatetags.mathinput_tags import as_mathinput, render_math, render_math_inline
+from django.test import SimpleTestCase
+from mathinput.templatetags.mathinput_tags import (
+    as_mathinput,
+    escape_latex_for_html,
+    render_math,
+    render_math_inline,
+)
 
 
 @pytest.mark.unit
@@ -63,6 +68,26 @@ def test_as_mathinput_with_mode_and_preset():
     assert len(result) > 0
 
 
+@pytest.mark.unit
+def test_as_mathinput_reuses_widget_per_configuration():
+    """
+    What we are testing: as_mathinput shares one widget per (mode, preset) and follows default-setting changes
+    Why we are testing: Performance - rendering a formula per table row must not rebuild the widget each time
+    Expected Result: Same widget for the same arguments; new defaults apply after the settings change
+    """
+    from django.test import override_settings
+    from mathinput.templatetags.mathinput_tags import _parse_widget_arg
+    from mathinput.widgets import get_shared_widget
+    
+    assert _parse_widget_arg('mode=matrices, preset=calculus') == ('matrices', 'calculus')
+    assert _parse_widget_arg('matrices') == ('matrices', None)
+    assert get_shared_widget('matrices', 'calculus') is get_shared_widget('matrices', 'calculus')
+    
+    with override_settings(MATHINPUT_DEFAULT_MODE='matrices'):
+        assert 'data-mode="matrices"' in as_mathinput('x')
+    assert 'data-mode="matrices"' not in as_mathinput('x')
+
+
 @pytest.mark.unit
 def test_render_math_renders_latex():
     """
@@ -144,6 +169,24 @@ def test_render_math_with_renderer_parameter():
     assert 'mathjax' in result2.lower() or 'data-latex' in result2
 
 
+@pytest.mark.unit
+def test_render_math_follows_renderer_setting_changes():
+    """
+    What we are testing: render_math / render_math_inline pick up MATHINPUT_RENDERER changes
+    Why we are testing: The setting is cached with the widget settings and must still follow override_settings
+    Expected Result: MathJax markup while the setting is overridden, KaTeX markup again afterwards
+    """
+    from django.test import override_settings
+    
+    assert 'katex-render' in render_math('x')
+    
+    with override_settings(MATHINPUT_RENDERER='MathJax'):
+        assert 'mathjax-render' in render_math('x')
+        assert 'mathjax' in render_math_inline('x')
+    
+    assert 'katex-render' in render_math('x')
+
+
 @pytest.mark.unit
 def test_render_math_removes_dollar_signs():
     """
@@ -159,6 +202,18 @@ def test_render_math_removes_dollar_signs():
     assert '$' not in result or result.count('$') < 2
 
 
+@pytest.mark.unit
+def test_render_math_removes_display_dollar_signs():
+    """
+    What we are testing: render_math strips $$ display delimiters as well as single $
+    Why we are testing: $$...$$ used to lose only one dollar sign on each side
+    Expected Result: data-latex holds the bare formula for both delimiter styles
+    """
+    assert 'data-latex="x^2 + 1"' in render_math('$$x^2 + 1$$', 'katex')
+    assert 'data-latex="x^2 + 1"' in render_math(' $x^2 + 1$ ', 'katex')
+    assert 'data-latex="x^2"' in render_math_inline('$$x^2$$', 'katex')
+
+
 @pytest.mark.unit
 def test_render_math_inline():
     """
@@ -190,9 +245,21 @@ def test_render_math_escapes_html():
     assert '&lt;' in result or '<' not in result or 'data-latex' in result
 
 
+@pytest.mark.unit
+def test_escape_latex_for_html_escapes_special_characters():
+    """
+    What we are testing: escape_latex_for_html replaces all five HTML special characters
+    Why we are testing: Security - escaped LaTeX must not break out of data-latex attributes
+    Expected Result: Each special character becomes its entity; existing entities stay literal text
+    """
+    assert escape_latex_for_html('a<b & c>"d\'') == 'a&lt;b &amp; c&gt;&quot;d&#x27;'
+    assert escape_latex_for_html('&lt;') == '&amp;lt;'
+    assert escape_latex_for_html(r'\frac{1}{2}') == r'\frac{1}{2}'
+
+
 @pytest.mark.unit
 @pytest.mark.integration
-class TestTemplateTagIntegration(TestCase):
+class TestTemplateTagIntegration(SimpleTestCase):
     """
     What we are testing: Template tags work in real Django templates
     Why we are testing: Template tags must integrate with Django template system
@@ -5,16 +5,8 @@ These tests provide thorough coverage of all unit-level functionality
 for widgets, validators, and security modules.
 """
 import pytest
-import os
-import django
-from django.conf import settings
 from django.core.exceptions import ValidationError
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import (
     MathInputValidator,
@@ -5,17 +5,9 @@ Comprehensive workflow tests for all 16 user stories to ensure
 complete end-to-end functionality.
 """
 import pytest
-import os
-import django
-from django.conf import settings
 from django.test import TestCase
 from django import forms
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import MathInputValidator
 from mathinput.templatetags.mathinput_tags import as_mathinput, render_math
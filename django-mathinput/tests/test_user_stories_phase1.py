@@ -4,15 +4,7 @@ User story tests for Phase 1.
 Tests user stories US-15 (Handle Errors Gracefully) and US-16 (Display Stored Formulas).
 """
 import pytest
-import os
-import django
 from django import forms
-from django.conf import settings
-
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
 
 from mathinput.widgets import MathInputWidget
 from mathinput.validators import MathInputValidator, validate_complexity
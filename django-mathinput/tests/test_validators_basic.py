@@ -5,16 +5,8 @@ These tests verify the validator functions work correctly.
 Full tests will be in Phase 1 testing.
 """
 import pytest
-import os
-import django
-from django.conf import settings
 from django.core.exceptions import ValidationError
 
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
-
 from mathinput.validators import (
     MathInputValidator,
     count_nesting,
@@ -97,6 +89,19 @@ def test_count_nesting_calculates_depth():
     assert count_nesting(r'x + y') == 0
 
 
+@pytest.mark.unit
+def test_count_nesting_ignores_escaped_brackets():
+    """
+    What we are testing: count_nesting skips escaped brackets but not brackets after an escaped backslash
+    Why we are testing: Escaped delimiters like \\{ are literal characters, not structure
+    Expected Result: Escaped brackets add no depth; '\\\\{' still opens a group
+    """
+    assert count_nesting(r'\{x\}') == 0
+    assert count_nesting(r'\left\{ x \right\}') == 0
+    assert count_nesting(r'a \\{b}') == 1
+    assert count_nesting(r'\frac{(a)}{[b]}') == 2
+
+
 @pytest.mark.unit
 @pytest.mark.security
 def test_validator_rejects_too_deeply_nested():
@@ -140,6 +145,20 @@ def test_get_matrix_size_detects_dimensions():
     assert size is None
 
 
+@pytest.mark.unit
+def test_get_matrix_size_environment_names_case_sensitive():
+    """
+    What we are testing: get_matrix_size matches environment names exactly
+    Why we are testing: LaTeX environment names are case-sensitive; Bmatrix and bmatrix differ
+    Expected Result: Bmatrix is sized with its own \\end; unknown casings are not matrices
+    """
+    size = get_matrix_size(r'\begin{Bmatrix} a & b \\ c & d \end{Bmatrix}')
+    assert size == (2, 2)
+    
+    size = get_matrix_size(r'\begin{PMATRIX} a & b \end{PMATRIX}')
+    assert size is None
+
+
 @pytest.mark.unit
 @pytest.mark.security
 def test_validator_rejects_oversized_matrix():
@@ -179,6 +198,26 @@ def test_validate_complexity_non_raising():
     assert any('too long' in issue.lower() for issue in issues)
 
 
+@pytest.mark.unit
+def test_validate_complexity_fast_fail_stops_at_first_issue():
+    """
+    What we are testing: validate_complexity(fast_fail=True) returns after the first issue
+    Why we are testing: Performance - rejected input should not pay for the remaining scans
+    Expected Result: One issue with fast_fail, all issues without it; valid input unaffected
+    """
+    unsafe = r'\input{file}' + r'\frac{' * 60 + '1' + '}' * 60
+    
+    is_valid, issues = validate_complexity(unsafe)
+    assert is_valid is False
+    assert len(issues) >= 2
+    
+    is_valid, issues = validate_complexity(unsafe, fast_fail=True)
+    assert is_valid is False
+    assert issues == ["Formula contains unsafe content"]
+    
+    assert validate_complexity(r'\frac{1}{2}', fast_fail=True) == (True, [])
+
+
 @pytest.mark.unit
 def test_validator_sanitizes_output():
     """
@@ -194,6 +233,25 @@ def test_validator_sanitizes_output():
     assert isinstance(result, str)
 
 
+@pytest.mark.unit
+def test_validator_results_cached_per_limits():
+    """
+    What we are testing: Repeated validation of the same formula reuses cached results per set of limits
+    Why we are testing: Performance - forms re-validate unchanged formulas; limits must not leak between validators
+    Expected Result: Repeat calls agree, errors are raised every time, and a stricter validator still rejects
+    """
+    formula = r'\frac{\frac{1}{2}}{3}'
+    lenient = MathInputValidator(max_nesting=5)
+    strict = MathInputValidator(max_nesting=1)
+    
+    assert lenient.validate(formula) == lenient.validate(formula) == formula
+    
+    for _ in range(2):
+        with pytest.raises(ValidationError) as exc_info:
+            strict.validate(formula)
+        assert 'too deeply nested' in str(exc_info.value).lower()
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
 
@@ -5,14 +5,6 @@ These tests verify the widget can be instantiated and has the correct structure.
 Full tests will be in Phase 1 testing.
 """
 import pytest
-import os
-import django
-from django.conf import settings
-
-# Configure Django settings for testing
-if not settings.configured:
-    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'tests.settings')
-    django.setup()
 
 from mathinput.widgets import MathInputWidget
 
@@ -68,6 +60,32 @@ def test_widget_media():
     assert 'mathinput/js/mathinput.js' in widget.Media.js
 
 
+@pytest.mark.unit
+def test_widget_media_shared_and_extended_by_subclasses():
+    """
+    What we are testing: Widget media is built once and still combines with a subclass's own Media
+    Why we are testing: media is served from a shared object; subclasses must keep Django's Media inheritance
+    Expected Result: Instances share one Media; subclasses get the widget assets plus their own, if any
+    """
+    class CustomMediaWidget(MathInputWidget):
+        class Media:
+            css = {'all': ('custom.css',)}
+            js = ('custom.js',)
+    
+    class PlainSubclassWidget(MathInputWidget):
+        pass
+    
+    assert MathInputWidget().media is MathInputWidget().media
+    
+    media = CustomMediaWidget().media
+    assert media._css['all'] == ['mathinput/css/mathinput.css', 'custom.css']
+    assert media._js == ['mathinput/js/mathinput.js', 'custom.js']
+    
+    media = PlainSubclassWidget().media
+    assert media._css['all'] == ['mathinput/css/mathinput.css']
+    assert media._js == ['mathinput/js/mathinput.js']
+
+
 @pytest.mark.unit
 def test_widget_renders_basic_html():
     """
@@ -86,3 +104,96 @@ def test_widget_renders_basic_html():
     assert 'mi-widget' in html or 'id_equation' in html
     assert 'equation' in html  # Field name should be in HTML
 
+
+@pytest.mark.unit
+def test_widget_follows_settings_changes():
+    """
+    What we are testing: Cached MATHINPUT_* settings are refreshed when settings change
+    Why we are testing: Settings are read once and cached; override_settings must still take effect
+    Expected Result: Defaults and renderer follow the overridden values, then revert
+    """
+    from django.test import override_settings
+    
+    MathInputWidget().render('equation', '')
+    
+    with override_settings(MATHINPUT_DEFAULT_MODE='matrices', MATHINPUT_RENDERER='mathjax'):
+        widget = MathInputWidget()
+        assert widget.mode == 'matrices'
+        assert "renderer: 'mathjax'" in widget.render('equation', '')
+    
+    widget = MathInputWidget()
+    assert widget.mode == 'regular_functions'
+    assert "renderer: 'katex'" in widget.render('equation', '')
+
+
+@pytest.mark.unit
+def test_widget_extensions_json_follows_settings_changes():
+    """
+    What we are testing: The cached JSON form of MATHINPUT_KATEX_EXTENSIONS tracks the setting
+    Why we are testing: The JSON is computed once and reused across renders
+    Expected Result: Comma-separated and list settings both serialize; changes are picked up
+    """
+    from django.test import override_settings
+    
+    MathInputWidget().render('equation', '')
+    
+    with override_settings(MATHINPUT_KATEX_EXTENSIONS='mhchem, physics'):
+        assert 'extensions: ["mhchem", "physics"]' in MathInputWidget().render('equation', '')
+    
+    with override_settings(MATHINPUT_KATEX_EXTENSIONS=['cancel']):
+        assert 'extensions: ["cancel"]' in MathInputWidget().render('equation', '')
+
+
+@pytest.mark.unit
+def test_widget_render_does_not_mutate_attrs():
+    """
+    What we are testing: render() leaves the caller's attrs dict unchanged
+    Why we are testing: Callers (Django forms, shared attrs dicts) should not see the generated id
+    Expected Result: attrs without an id stay without one; the rendered HTML still uses id_<name>
+    """
+    widget = MathInputWidget()
+    attrs = {'class': 'formula'}
+    
+    html = widget.render('equation', '', attrs)
+    
+    assert attrs == {'class': 'formula'}
+    assert 'id="id_equation"' in html
+
+
+@pytest.mark.unit
+def test_widget_render_many_matches_render():
+    """
+    What we are testing: render_many() renders each (name, value) pair like render()
+    Why we are testing: The batch path shares template and settings lookups and must not drift from render()
+    Expected Result: One HTML string per pair, identical to the individual render() output
+    """
+    widget = MathInputWidget(mode='matrices', preset='calculus')
+    items = [('equation', r'\frac{1}{2}'), ('answer', None), ('row-0-formula', 'x < 1')]
+    
+    assert widget.render_many(items) == [widget.render(name, value) for name, value in items]
+    assert widget.render_many([]) == []
+
+
+@pytest.mark.unit
+def test_widget_render_escapes_value_for_html_and_js():
+    """
+    What we are testing: render() escapes the value for the textarea and for the init script separately
+    Why we are testing: Security - the value is user input; the script needs the raw LaTeX as a JS string
+    Expected Result: HTML-escaped text in the textarea; a quoted, JS-escaped string in the script that
+        cannot end the string or the script; '' for empty values
+    """
+    widget = MathInputWidget()
+    
+    html = widget.render('equation', 'x < 1 & </script><script>alert(1)')
+    assert '>x &lt; 1 &amp; &lt;/script&gt;&lt;script&gt;alert(1)</textarea>' in html
+    assert '&amp;lt;' not in html
+    assert '<script>alert(1)' not in html
+    assert "value: 'x \\u003C 1 \\u0026 \\u003C/script\\u003E\\u003Cscript\\u003Ealert(1)'," in html
+    
+    html = widget.render('equation', "0, x: alert(1)")
+    assert "value: '0, x: alert(1)'," in html
+    
+    html = widget.render('equation', "\\frac{1}{2}' + alert(1) + '")
+    assert "value: '\\u005Cfrac{1}{2}\\u0027 + alert(1) + \\u0027'," in html
+    
+    assert "value: ''," in widget.render('equation', None)